@@ -3,6 +3,7 @@
 from .turing_machine import (
     DeltaFunction,
     TMConfiguration,
+    TuringMachine,
     create_initial_config,
     step,
     run_until_halt,
@@ -10,6 +11,7 @@ from .turing_machine import (
     display_config,
     run_animated,
 )
+from .snapshot import save_checkpoint, load_checkpoint
 from .__main__ import cli
 from .version import __version__
 
@@ -18,12 +20,15 @@ from .version import __version__
 __all__ = [
     "DeltaFunction",
     "TMConfiguration",
+    "TuringMachine",
     "create_initial_config",
     "step",
     "run_until_halt",
     "run_with_history",
     "display_config",
     "run_animated",
+    "save_checkpoint",
+    "load_checkpoint",
     "cli",
     "__version__",
 ]
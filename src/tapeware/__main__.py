@@ -1,15 +1,34 @@
 # SPDX-License-Identifier: CC0-1.0
 
 import typer
+from enum import Enum
 from termcolor import colored, cprint
 from typing import Annotated
 
-from tapeware.turing_machine import DeltaFunction, create_initial_config, run_animated
+from tapeware.check import DEFAULT_MAX_STEPS
+from tapeware.turing_machine import DeltaFunction, create_initial_config, display_config, run_animated
 from tapeware.version import __version__
 
 
 app = typer.Typer(help="Tapeware - Turing machine simulator.")
 
+# Step cap per machine in bulk mode, where most machines never halt
+BULK_MAX_STEPS = 10_000
+
+
+class ReportFormat(str, Enum):
+    table = "table"
+    json = "json"
+    junit = "junit"
+
+
+class Example(str, Enum):
+    anbn = "anbn"
+    anbncn = "anbncn"
+    anbncn_alt = "anbncn-alt"
+    end_ab = "end-ab"
+    equal_01 = "equal-01"
+
 
 @app.callback()
 def main(
@@ -17,6 +36,13 @@ def main(
     delay: Annotated[float, typer.Option(help="Delay between steps in seconds")] = 0.08,
     no_delay: Annotated[bool, typer.Option(help="Disable delay between steps")] = False,
     no_wait: Annotated[bool, typer.Option(help="Disable waiting for user input between tests")] = False,
+    check: Annotated[bool, typer.Option(help="Run headless and report pass/fail against expected results")] = False,
+    report: Annotated[ReportFormat, typer.Option(help="Report format in check mode")] = ReportFormat.table,
+    jobs: Annotated[int | None, typer.Option(min=1, help="Worker processes in check mode (default: all cores)")] = None,
+    max_steps: Annotated[
+        int | None,
+        typer.Option(min=1, help=f"Step cap per input (default: {DEFAULT_MAX_STEPS}, bulk: {BULK_MAX_STEPS})"),
+    ] = None,
     version: Annotated[bool, typer.Option("--version", help="Show version and exit")] = False,
 ) -> None:
     """Tapeware - Turing machine simulator."""
@@ -28,6 +54,10 @@ def main(
         "delay": delay,
         "no_delay": no_delay,
         "no_wait": no_wait,
+        "check": check,
+        "report": report,
+        "jobs": jobs,
+        "max_steps": max_steps,
     }
 
 
@@ -101,11 +131,164 @@ def equal_01(
         run(ctx, delta, test_cases)
 
 
+@app.command(name="all")
+def all_examples(ctx: typer.Context) -> None:
+    """Run the test cases of every example Turing machine."""
+    from tapeware.examples import anbn, anbncn, anbncn_alt, end_ab, equal_01
+
+    examples = (anbn, anbncn, anbncn_alt, end_ab, equal_01)
+    if ctx.obj["check"]:
+        run_check(ctx, [(example.delta, example.test_cases) for example in examples])
+    else:
+        for example in examples:
+            run(ctx, example.delta, example.test_cases)
+
+
+DEBUG_HELP = """Commands:
+  n [k]   step forward k transitions (default 1, Enter repeats)
+  b [k]   step back k transitions (default 1)
+  g <k>   go to transition k
+  e       run to the end (at most --max-steps transitions)
+  s       go back to the start
+  q       quit"""
+
+
+@app.command()
+def debug(
+    ctx: typer.Context,
+    machine: Annotated[Example, typer.Argument(help="Example machine to debug")],
+    input_str: Annotated[str, typer.Argument(metavar="input", help="Input string to process")] = "",
+) -> None:
+    """Scrub forward and back through a run without storing its history."""
+    import importlib
+    from tapeware.engine import Engine
+
+    delta = importlib.import_module(f"tapeware.examples.{machine.name}").delta
+    engine = Engine(create_initial_config(input_str, delta))
+    print(DEBUG_HELP)
+    print()
+
+    last = ["n"]
+    while True:
+        display_config(engine.config())
+        try:
+            command = input(f"[{engine.position}] debug> ").split() or last
+        except EOFError:
+            break
+        last = command
+        action, count = command[0], int(command[1]) if len(command) > 1 and command[1].isdigit() else None
+
+        if action == "q":
+            break
+        elif action == "n":
+            engine.run(count or 1)
+        elif action == "b":
+            engine.run_back(count or 1)
+        elif action == "g" and count is not None:
+            engine.seek(count)
+        elif action == "e":
+            engine.run(ctx.obj["max_steps"] or DEFAULT_MAX_STEPS)
+        elif action == "s":
+            engine.seek(0)
+        else:
+            print(DEBUG_HELP)
+
+
+@app.command(name="profile")
+def profile_machines(
+    ctx: typer.Context,
+    machines: Annotated[list[Example], typer.Argument(help="Example machines to profile")],
+    n_min: Annotated[int, typer.Option(min=0, help="Smallest input size")] = 1,
+    n_max: Annotated[int, typer.Option(min=1, help="Largest input size")] = 10,
+    csv: Annotated[bool, typer.Option("--csv", help="Print the measurements as CSV")] = False,
+) -> None:
+    """Measure steps and tape usage over a family of inputs and fit their growth."""
+    import importlib
+    from tapeware.profiler import FAMILIES, format_csv, format_report, profile
+
+    ns = range(n_min, n_max + 1)
+    max_steps = ctx.obj["max_steps"] or DEFAULT_MAX_STEPS
+    results = {}
+    for machine in machines:
+        delta = importlib.import_module(f"tapeware.examples.{machine.name}").delta
+        results[machine.value] = profile(delta, FAMILIES[machine.name], ns, max_steps)
+
+    if csv:
+        print(format_csv(results), end="")
+    else:
+        print("\n\n".join(format_report(name, runs) for name, runs in results.items()))
+
+
+@app.command()
+def bulk(
+    ctx: typer.Context,
+    states: Annotated[int, typer.Argument(min=1, max=25, help="Number of states")],
+    symbols: Annotated[int, typer.Argument(min=2, max=10, help="Number of tape symbols, 0 being the blank")],
+    input_str: Annotated[str, typer.Option("--input", help="Input as digits, e.g. 0110 (default: blank tape)")] = "",
+    top: Annotated[int, typer.Option(min=0, help="Number of longest-running halting machines to list")] = 10,
+) -> None:
+    """Run every machine of a given size, e.g. busy beaver candidates, across worker processes."""
+    import heapq
+    from collections import Counter
+    from tapeware.bulk import enumerate_machines, format_machine, run_bulk
+
+    if not set(input_str) <= set("0123456789"[:symbols]):
+        raise typer.BadParameter(f"Input must consist of the digits 0 to {symbols - 1}", param_hint="--input")
+
+    results = run_bulk(
+        enumerate_machines(states, symbols, prune=not input_str),
+        states,
+        symbols,
+        tuple(int(digit) for digit in input_str),
+        max_steps=ctx.obj["max_steps"] or BULK_MAX_STEPS,
+        jobs=ctx.obj["jobs"],
+    )
+    outcomes: Counter[str] = Counter()
+    longest = []
+    for result in results:
+        outcomes[result.outcome] += 1
+        if result.outcome == "halted":
+            # Keep the top machines by steps, then sigma, preferring the smallest code on ties
+            entry = (result.steps, result.sigma, -result.code, result)
+            if len(longest) < top:
+                heapq.heappush(longest, entry)
+            elif top and entry[:3] > longest[0][:3]:
+                heapq.heapreplace(longest, entry)
+
+    summary = ", ".join(f"{outcome} {outcomes[outcome]}" for outcome in ("halted", "cycle", "escape", "timeout"))
+    print(f"{outcomes.total()} machines: {summary}")
+    if longest:
+        width = 3 * states * symbols + states - 1
+        print()
+        print(f"{'steps':>8}  {'sigma':>5}  {'machine':<{width}}  tape")
+        for steps, sigma, _, result in sorted(longest, key=lambda entry: entry[:3], reverse=True):
+            machine = format_machine(result.code, states, symbols)
+            print(f"{steps:>8}  {sigma:>5}  {machine:<{width}}  {''.join(map(str, result.tape))}")
+
+
+def run_check(
+    ctx: typer.Context,
+    machines: list[tuple[DeltaFunction, tuple[tuple[str, bool | None], ...]]],
+) -> None:
+    """Run inputs headless across worker processes, print a report and exit 1 on any mismatch."""
+    from tapeware.check import FORMATTERS, run_checks
+
+    cases = [(delta, input_str, expected) for delta, inputs in machines for input_str, expected in inputs]
+    results = run_checks(cases, jobs=ctx.obj["jobs"], max_steps=ctx.obj["max_steps"] or DEFAULT_MAX_STEPS)
+    print(FORMATTERS[ctx.obj["report"].value](results))
+    if not all(result.passed for result in results):
+        raise typer.Exit(code=1)
+
+
 def run(
     ctx: typer.Context,
     delta: DeltaFunction,
     inputs: tuple[tuple[str, bool | None], ...],
 ) -> None:
+    if ctx.obj["check"]:
+        run_check(ctx, [(delta, inputs)])
+        return
+
     print("=" * 80)
     cprint(delta.__doc__, "cyan", attrs=["bold"])
     print("=" * 80)
@@ -0,0 +1,232 @@
+# SPDX-License-Identifier: CC0-1.0
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from tapeware.turing_machine import DeltaFunction
+
+# Type alias for a tabulated delta function: (state, symbol) -> transition or None
+TransitionTable = dict[tuple[str, str], tuple[str, str, str] | None]
+
+
+@dataclass(frozen=True)
+class Sweep:
+    """
+    A self-loop that moves the head over a run of symbols without changing them.
+
+    While in `state` and reading any of `symbols`, the machine keeps its state,
+    rewrites the same symbol and moves in `direction`, so an engine may cross a
+    whole run of these symbols in one operation.
+    """
+
+    state: str
+    direction: str
+    symbols: frozenset[str]
+
+
+@dataclass(frozen=True)
+class MachineReport:
+    """
+    Result of analysing a tabulated machine.
+
+    `table` is the minimised transition table: unreachable states, dead
+    transitions and missing (None) transitions are dropped and every class of
+    equivalent states is merged into its representative.
+    """
+
+    states: frozenset[str]
+    unreachable_states: frozenset[str]
+    dead_transitions: frozenset[tuple[str, str]]
+    equivalent_states: tuple[frozenset[str], ...]
+    sweeps: tuple[Sweep, ...]
+    table: TransitionTable
+
+    @property
+    def alphabet(self) -> frozenset[str]:
+        """Get all symbols the minimised table dispatches on."""
+        return frozenset(symbol for _, symbol in self.table)
+
+
+def tabulate(
+    delta: DeltaFunction,
+    input_alphabet: Iterable[str],
+    initial_state: str = "q₀",
+    accept_states: set[str] | None = None,
+    reject_states: set[str] | None = None,
+    blank_symbol: str = "□",
+    states: Iterable[str] = (),
+) -> TransitionTable:
+    """
+    Tabulate a delta function by exploring it from the initial state.
+
+    Every reachable state is probed with every symbol that can ever be on the
+    tape (the input alphabet, the blank and anything written), until no new
+    states or symbols appear. Halting states and the extra `states` are probed
+    as well, so that analyse() can report their transitions as dead.
+    """
+    halting = set(accept_states or {"qₐ"}) | set(reject_states or {"qᵣ"})
+    symbols: list[str] = list(dict.fromkeys([blank_symbol, *input_alphabet]))
+    known_states: list[str] = list(dict.fromkeys([initial_state, *halting, *states]))
+    table: TransitionTable = {}
+
+    changed = True
+    while changed:
+        changed = False
+        for state in list(known_states):
+            for symbol in list(symbols):
+                if (state, symbol) in table:
+                    continue
+                result = delta(state, symbol)
+                table[state, symbol] = result
+                changed = True
+                if result is None or state in halting:
+                    continue
+                new_state, written, _ = result
+                if new_state not in known_states:
+                    known_states.append(new_state)
+                if written not in symbols:
+                    symbols.append(written)
+
+    return table
+
+
+def table_delta(table: TransitionTable) -> DeltaFunction:
+    """Turn a transition table back into a delta function backed by a dict lookup."""
+    lookup = table.get
+
+    def delta(state: str, symbol: str) -> tuple[str, str, str] | None:
+        return lookup((state, symbol))
+
+    delta.__doc__ = f"Tabulated Turing machine with {len(table)} transitions"
+    return delta
+
+
+def _reachable(
+    table: TransitionTable, initial_state: str, halting: set[str], reject_state: str
+) -> set[str]:
+    # A missing transition sends the machine to the canonical reject state
+    successors: dict[str, set[str]] = {}
+    for (state, _), result in table.items():
+        successors.setdefault(state, set()).add(reject_state if result is None else result[0])
+
+    reachable = {initial_state}
+    frontier = [initial_state]
+    while frontier:
+        state = frontier.pop()
+        if state in halting:
+            continue
+        for target in successors.get(state, ()):
+            if target not in reachable:
+                reachable.add(target)
+                frontier.append(target)
+    return reachable
+
+
+def _equivalence_classes(
+    table: TransitionTable, states: list[str], symbols: list[str], halting: set[str]
+) -> dict[str, int]:
+    """
+    Partition states into behaviourally equivalent classes (Moore's algorithm).
+
+    Halting states stay singletons so the final state of every run is preserved.
+    Two working states are equivalent when, for every symbol, they write the same
+    symbol, move the same way and continue in equivalent states.
+    """
+    ids: dict[object, int] = {}
+    block = {state: ids.setdefault(state if state in halting else None, len(ids)) for state in states}
+
+    while True:
+        ids = {}
+        refined: dict[str, int] = {}
+        for state in states:
+            key: object = state
+            if state not in halting:
+                row = (table.get((state, symbol)) for symbol in symbols)
+                key = (block[state], tuple(None if r is None else (block[r[0]], r[1], r[2]) for r in row))
+            refined[state] = ids.setdefault(key, len(ids))
+        if len(ids) == len(set(block.values())):
+            return refined
+        block = refined
+
+
+def analyse(
+    table: TransitionTable,
+    initial_state: str = "q₀",
+    accept_states: set[str] | None = None,
+    reject_states: set[str] | None = None,
+) -> MachineReport:
+    """
+    Find unreachable states, dead transitions, equivalent states and sweep loops.
+
+    Dead transitions are entries that can never fire: those of halting states
+    (the engine stops before consulting delta) and those of unreachable states.
+    A None entry counts as an edge to the smallest reject state, which is where
+    step() sends the machine.
+    """
+    rejecting = set(reject_states or {"qᵣ"})
+    halting = set(accept_states or {"qₐ"}) | rejecting
+    targets = (result[0] for result in table.values() if result is not None)
+    all_states = list(dict.fromkeys([initial_state, *(state for state, _ in table), *targets]))
+    symbols = list(dict.fromkeys(symbol for _, symbol in table))
+    reachable = _reachable(table, initial_state, halting, min(rejecting))
+
+    unreachable = frozenset(state for state in all_states if state not in reachable)
+    dead = frozenset(
+        key
+        for key, result in table.items()
+        if result is not None and (key[0] in halting or key[0] in unreachable)
+    )
+    live_states = [state for state in all_states if state in reachable]
+
+    block = _equivalence_classes(table, live_states, symbols, halting)
+    members: dict[int, list[str]] = {}
+    for state in live_states:
+        members.setdefault(block[state], []).append(state)
+    representative = {
+        state: initial_state if initial_state in group else group[0] for group in members.values() for state in group
+    }
+
+    minimised: TransitionTable = {}
+    for (state, symbol), result in table.items():
+        # Missing transitions already reject through table_delta's dict lookup
+        if result is None or state in halting or state not in reachable or representative[state] != state:
+            continue
+        target, written, direction = result
+        minimised[state, symbol] = (representative.get(target, target), written, direction)
+
+    sweep_symbols: dict[tuple[str, str], set[str]] = {}
+    for (state, symbol), result in minimised.items():
+        if result[0] == state and result[1] == symbol:
+            sweep_symbols.setdefault((state, result[2]), set()).add(symbol)
+
+    return MachineReport(
+        states=frozenset(reachable),
+        unreachable_states=unreachable,
+        dead_transitions=dead,
+        equivalent_states=tuple(frozenset(group) for group in members.values() if len(group) > 1),
+        sweeps=tuple(
+            Sweep(state, direction, frozenset(symbols)) for (state, direction), symbols in sweep_symbols.items()
+        ),
+        table=minimised,
+    )
+
+
+def minimise(
+    delta: DeltaFunction,
+    input_alphabet: Iterable[str],
+    initial_state: str = "q₀",
+    accept_states: set[str] | None = None,
+    reject_states: set[str] | None = None,
+    blank_symbol: str = "□",
+) -> tuple[DeltaFunction, MachineReport]:
+    """
+    Tabulate, analyse and minimise a machine in one pass.
+
+    Returns a table-backed delta function that accepts the same inputs with the
+    same tape contents, together with the analysis report.
+    """
+    table = tabulate(delta, input_alphabet, initial_state, accept_states, reject_states, blank_symbol)
+    report = analyse(table, initial_state, accept_states, reject_states)
+    minimised = table_delta(report.table)
+    minimised.__doc__ = delta.__doc__
+    return minimised, report
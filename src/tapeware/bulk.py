@@ -0,0 +1,245 @@
+# SPDX-License-Identifier: CC0-1.0
+
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+
+from tapeware.turing_machine import TuringMachine
+
+# Name of the halting state of decoded machines; the others are A, B, C, ...
+HALT = "Z"
+
+# Transition table entry: (written symbol, move, next state); move is -1 or +1
+# and next state == states means halt
+Entry = tuple[int, int, int]
+
+
+def base(states: int, symbols: int) -> int:
+    """Get the number of distinct transition entries, i.e. the radix of the encoding."""
+    return (states + 1) * 2 * symbols
+
+
+def machine_count(states: int, symbols: int) -> int:
+    """Get the number of machines with the given number of states and symbols."""
+    return base(states, symbols) ** (states * symbols)
+
+
+def encode(table: list[Entry], states: int, symbols: int) -> int:
+    """
+    Encode a transition table as a single integer.
+
+    The table has one entry per (state, read symbol), in the order
+    state * symbols + symbol. Each entry is a digit of the code in radix
+    base(states, symbols), the first entry being the least significant.
+    """
+    if len(table) != states * symbols:
+        raise ValueError(f"Expected {states * symbols} transitions, got {len(table)}")
+    radix = base(states, symbols)
+    code = 0
+    for written, move, next_state in reversed(table):
+        if not 0 <= written < symbols or move not in (-1, 1) or not 0 <= next_state <= states:
+            raise ValueError(f"Invalid transition {(written, move, next_state)}")
+        code = code * radix + (next_state * 2 + (move > 0)) * symbols + written
+    return code
+
+
+def decode(code: int, states: int, symbols: int) -> list[Entry]:
+    """Decode an integer produced by encode() back into a transition table."""
+    if not 0 <= code < machine_count(states, symbols):
+        raise ValueError(f"Code {code} out of range for {states} states and {symbols} symbols")
+    radix = base(states, symbols)
+    table = []
+    for _ in range(states * symbols):
+        code, digit = divmod(code, radix)
+        digit, written = divmod(digit, symbols)
+        next_state, right = divmod(digit, 2)
+        table.append((written, 1 if right else -1, next_state))
+    return table
+
+
+def enumerate_machines(states: int, symbols: int, prune: bool = True) -> Iterator[int]:
+    """
+    Enumerate the codes of all machines of a given size, in increasing order.
+
+    With prune, trivial machines for a run on a blank tape are skipped:
+    machines whose first transition (state A on a blank) moves left are mirror
+    images of one that moves right, and machines whose first transition halts
+    or stays in A halt after one step or run off into blanks forever.
+    """
+    radix = base(states, symbols)
+    if not prune:
+        yield from range(machine_count(states, symbols))
+        return
+    rest = radix ** (states * symbols - 1)
+    for high in range(rest):
+        for digit in range(radix):
+            next_state, right = divmod(digit // symbols, 2)
+            if right and next_state not in (0, states):
+                yield high * radix + digit
+
+
+def _state_name(state: int, states: int) -> str:
+    return HALT if state == states else chr(ord("A") + state)
+
+
+def _coded_delta(
+    table: list[Entry], states: int, symbols: int, state: str, symbol: str
+) -> tuple[str, str, str] | None:
+    if state == HALT or not symbol.isdigit() or int(symbol) >= symbols:
+        return None
+    written, move, next_state = table[(ord(state) - ord("A")) * symbols + int(symbol)]
+    return _state_name(next_state, states), str(written), "R" if move > 0 else "L"
+
+
+def to_machine(code: int, states: int, symbols: int) -> TuringMachine:
+    """
+    Build a TuringMachine from a code, to run or analyse it with the rest of tapeware.
+
+    States are named A, B, C, ... and start in A, the halting state Z accepts,
+    and tape symbols are the digits 0 to symbols - 1 with 0 as the blank.
+    """
+    if not 0 < states < 26 or not 0 < symbols <= 10:
+        raise ValueError("Decoded machines support 1 to 25 states and 1 to 10 symbols")
+    delta = partial(_coded_delta, decode(code, states, symbols), states, symbols)
+    return TuringMachine(delta, initial_state="A", accept_states={HALT}, blank_symbol="0")
+
+
+@dataclass(frozen=True)
+class BulkResult:
+    """
+    Outcome of running one encoded machine.
+
+    outcome is 'halted', 'cycle' (a configuration repeated exactly),
+    'escape' (the head runs off into blank tape without ever halting) or
+    'timeout' (max_steps reached first). tape holds the non-blank span of the
+    final tape and head is relative to its first cell.
+    """
+
+    code: int
+    outcome: str
+    steps: int
+    tape: tuple[int, ...]
+    head: int
+
+    @property
+    def sigma(self) -> int:
+        """Get the number of non-blank symbols left on the tape."""
+        return sum(1 for symbol in self.tape if symbol)
+
+
+def _escapes(table: list[Entry], state: int, states: int, symbols: int, direction: int) -> bool:
+    """Check if, reading only blanks, the machine keeps moving in direction and never halts."""
+    seen = set()
+    while state != states and state not in seen:
+        _, move, next_state = table[state * symbols]
+        if move != direction:
+            return False
+        seen.add(state)
+        state = next_state
+    return state != states
+
+
+def simulate(
+    code: int, states: int, symbols: int, input_symbols: tuple[int, ...] = (), max_steps: int = 10_000
+) -> BulkResult:
+    """
+    Run one encoded machine from state A on the input, or on a blank tape.
+
+    The transition table is unpacked into flat lists, so the inner loop is a
+    handful of list and bytearray lookups per step. A run is cut short when
+    the head enters fresh blank tape in a state whose blank transitions keep
+    it going that way without halting (escape), or when the configuration at
+    the latest power-of-two checkpoint repeats (cycle, Brent's method).
+    """
+    if any(not 0 <= symbol < symbols for symbol in input_symbols):
+        raise ValueError(f"Input symbols must be between 0 and {symbols - 1}")
+    table = decode(code, states, symbols)
+    writes = [entry[0] for entry in table]
+    moves = [entry[1] for entry in table]
+    nexts = [entry[2] * symbols for entry in table]
+    halt = states * symbols
+
+    tape = bytearray(input_symbols or (0,))
+    head = 0
+    low, high = 0, len(tape) - 1  # visited cells; everything beyond is blank
+    state = 0
+    steps = 0
+    outcome = "timeout"
+    checkpoint = 1
+    saved: tuple[int, int, bytes] | None = None
+
+    while steps < max_steps:
+        index = state + tape[head]
+        tape[head] = writes[index]
+        head += moves[index]
+        state = nexts[index]
+        steps += 1
+
+        if head < 0:
+            tape[0:0] = bytes(len(tape))
+            head += len(tape) // 2
+            low += len(tape) // 2
+            high += len(tape) // 2
+        elif head >= len(tape):
+            tape.extend(bytes(len(tape)))
+        fresh = head < low or head > high
+        if fresh:
+            low, high = min(low, head), max(high, head)
+        if state == halt:
+            outcome = "halted"
+            break
+        if fresh and _escapes(table, state // symbols, states, symbols, -1 if head == low else 1):
+            outcome = "escape"
+            break
+
+        if saved is not None and saved[0] == state and saved[1] == head - low and saved[2] == tape[low : high + 1]:
+            outcome = "cycle"
+            break
+        if steps == checkpoint:
+            saved = (state, head - low, bytes(tape[low : high + 1]))
+            checkpoint *= 2
+
+    start = next((i for i in range(low, high + 1) if tape[i]), head)
+    end = next((i for i in range(high, low - 1, -1) if tape[i]), head)
+    start, end = min(start, head), max(end, head)
+    return BulkResult(code, outcome, steps, tuple(tape[start : end + 1]), head - start)
+
+
+def run_bulk(
+    codes: Iterable[int],
+    states: int,
+    symbols: int,
+    input_symbols: tuple[int, ...] = (),
+    max_steps: int = 10_000,
+    jobs: int | None = None,
+    chunksize: int = 4096,
+) -> Iterator[BulkResult]:
+    """
+    Run many encoded machines on one input across worker processes.
+
+    Yields results in the order of codes, so large enumerations can be
+    aggregated without holding every result. With jobs=1 everything runs in
+    this process. Codes are handed to the workers in chunks, so each machine
+    only costs an integer to send and a small result to receive.
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    run = partial(simulate, states=states, symbols=symbols, input_symbols=input_symbols, max_steps=max_steps)
+    if jobs == 1:
+        yield from map(run, codes)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(run, codes, chunksize=chunksize)
+
+
+def format_machine(code: int, states: int, symbols: int) -> str:
+    """Format a machine in the usual busy beaver notation, e.g. '1RB1LB_1LA1RZ'."""
+    table = decode(code, states, symbols)
+    return "_".join(
+        "".join(
+            f"{written}{'R' if move > 0 else 'L'}{_state_name(next_state, states)}"
+            for written, move, next_state in table[state * symbols : (state + 1) * symbols]
+        )
+        for state in range(states)
+    )
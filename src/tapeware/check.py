@@ -0,0 +1,140 @@
+# SPDX-License-Identifier: CC0-1.0
+
+import json
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass
+from xml.etree import ElementTree
+
+from termcolor import colored
+
+from tapeware.turing_machine import DeltaFunction, create_initial_config, run_until_halt
+
+
+@dataclass(frozen=True)
+class CheckResult:
+    """Outcome of running one input through a machine without rendering."""
+
+    machine: str
+    input: str
+    expected: bool | None
+    accepted: bool
+    halted: bool
+    steps: int
+    seconds: float
+
+    @property
+    def passed(self) -> bool:
+        """
+        Check if the outcome matches the expected one.
+
+        Inputs without an expected outcome pass as long as the machine halts.
+        """
+        return self.halted and (self.expected is None or self.accepted == self.expected)
+
+    @property
+    def outcome(self) -> str:
+        """Get 'ACCEPT', 'REJECT' or 'TIMEOUT' if the step cap was hit first."""
+        if not self.halted:
+            return "TIMEOUT"
+        return "ACCEPT" if self.accepted else "REJECT"
+
+
+def machine_name(delta: DeltaFunction) -> str:
+    """Get the short name of a machine, e.g. 'anbncn' for tapeware.examples.anbncn.delta."""
+    return delta.__module__.rpartition(".")[2]
+
+
+# Step cap per input, so one machine that never halts cannot hang a whole check run
+DEFAULT_MAX_STEPS = 1_000_000
+
+
+def check_case(
+    delta: DeltaFunction, input_str: str, expected: bool | None, max_steps: int = DEFAULT_MAX_STEPS
+) -> CheckResult:
+    """Run a single input until it halts or hits max_steps, and time it."""
+    start = time.perf_counter()
+    final = run_until_halt(create_initial_config(input_str, delta), max_steps)
+    seconds = time.perf_counter() - start
+    return CheckResult(
+        machine_name(delta), input_str, expected, final.is_accepted(), final.is_halted(), final.steps, seconds
+    )
+
+
+def run_checks(
+    cases: list[tuple[DeltaFunction, str, bool | None]],
+    jobs: int | None = None,
+    max_steps: int = DEFAULT_MAX_STEPS,
+) -> list[CheckResult]:
+    """
+    Run many cases concurrently across worker processes.
+
+    Results come back in the order of cases. With jobs=1 everything runs in
+    this process, which avoids the pool start-up cost for small batches.
+    Delta functions must be importable module-level functions to be sent to
+    the workers. Cases still running after max_steps are reported as timeouts.
+    """
+    if jobs is not None and jobs < 1:
+        raise ValueError("jobs must be at least 1")
+    if jobs == 1 or len(cases) <= 1:
+        return [check_case(*case, max_steps) for case in cases]
+    deltas, inputs, expected = zip(*cases)
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        return list(pool.map(check_case, deltas, inputs, expected, [max_steps] * len(cases)))
+
+
+def format_table(results: list[CheckResult]) -> str:
+    """Format results as a compact pass/fail table with a summary line."""
+    width = max([len("machine"), *(len(r.machine) for r in results)])
+    input_width = max([len("input"), *(len(repr(r.input)) for r in results)])
+    lines = [f"{'machine':<{width}}  {'input':<{input_width}}  expected  result   {'steps':>8}  {'time':>9}  status"]
+    for r in results:
+        expected = "-" if r.expected is None else ("ACCEPT" if r.expected else "REJECT")
+        status = colored("PASS", "green") if r.passed else colored("FAIL", "red", attrs=["bold"])
+        lines.append(
+            f"{r.machine:<{width}}  {r.input!r:<{input_width}}  {expected:<8}  {r.outcome:<7}  "
+            f"{r.steps:>8}  {r.seconds * 1000:>7.2f}ms  {status}"
+        )
+    failed = sum(not r.passed for r in results)
+    lines.append(f"{len(results) - failed} passed, {failed} failed")
+    return "\n".join(lines)
+
+
+def format_json(results: list[CheckResult]) -> str:
+    """Format results as a JSON list of objects."""
+    return json.dumps(
+        [{**asdict(r), "outcome": r.outcome, "passed": r.passed} for r in results], indent=2, ensure_ascii=False
+    )
+
+
+def format_junit(results: list[CheckResult]) -> str:
+    """Format results as a JUnit XML report with one test suite per machine."""
+    root = ElementTree.Element("testsuites")
+    suites: dict[str, ElementTree.Element] = {}
+    for r in results:
+        suite = suites.get(r.machine)
+        if suite is None:
+            suite = suites[r.machine] = ElementTree.SubElement(root, "testsuite", name=r.machine)
+        case = ElementTree.SubElement(
+            suite, "testcase", classname=f"tapeware.{r.machine}", name=repr(r.input), time=f"{r.seconds:.6f}"
+        )
+        if not r.passed:
+            if r.halted:
+                message = f"{'accepted' if r.accepted else 'rejected'} after {r.steps} steps"
+            else:
+                message = f"did not halt within {r.steps} steps"
+            ElementTree.SubElement(case, "failure", message=message)
+
+    for name, suite in suites.items():
+        machine_results = [r for r in results if r.machine == name]
+        suite.set("tests", str(len(machine_results)))
+        suite.set("failures", str(sum(not r.passed for r in machine_results)))
+        suite.set("time", f"{sum(r.seconds for r in machine_results):.6f}")
+    return ElementTree.tostring(root, encoding="unicode")
+
+
+FORMATTERS = {
+    "table": format_table,
+    "json": format_json,
+    "junit": format_junit,
+}
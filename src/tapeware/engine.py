@@ -0,0 +1,242 @@
+# SPDX-License-Identifier: CC0-1.0
+
+from array import array
+
+from tapeware.shared import SharedTape, pack_names
+from tapeware.turing_machine import TMConfiguration, TuringMachine
+
+# Undo log moves, stored in the top two bits of the logged state id
+_LEFT = 0
+_RIGHT = 1 << 14
+_STAY = 2 << 14
+_STATE_MASK = (1 << 14) - 1
+
+
+class Engine:
+    """
+    Mutable, reversible execution engine for a Turing machine.
+
+    The tape is a bytearray of symbol ids, so the engine supports at most 256
+    distinct symbols and 16384 states. Every transition appends the overwritten
+    symbol (1 byte) and the previous state together with the move (2 bytes) to
+    an undo log of packed arrays. That is enough to undo a step of a
+    deterministic machine, so a run can be scrubbed forward and back without
+    storing any configurations; pass record=False to skip the log.
+
+    A None transition moves to the reject state without counting a step, like
+    step() does, but is still logged, so `position` (transitions executed) can
+    be ahead of `steps`.
+
+    With a SharedTape the cells live in a memory-mapped segment that other
+    processes can read through tapeware.shared.SharedTapeView. The cells,
+    head, state and steps are published together every publish_every
+    transitions of run() and run_back(), when they return, and on publish().
+    """
+
+    def __init__(
+        self, config: TMConfiguration, record: bool = True, shared: SharedTape | None = None, publish_every: int = 4096
+    ) -> None:
+        self.machine: TuringMachine = config.machine
+        self.symbols: list[str] = []
+        self.symbol_ids: dict[str, int] = {}
+        self.blank_id = self.intern(self.machine.blank)
+        self.tape: bytearray | memoryview = bytearray(self.intern(symbol) for symbol in config.tape)
+        self.head = config.head
+        self.origin = config.origin
+        self.state_id = config.state_id
+        self.steps = config.steps
+        self.record = record
+        self.undo_symbols = array("B")
+        self.undo_states = array("H")
+        # Compiled transitions: (state id, symbol id) -> (state id, symbol id, move)
+        self.transitions: dict[tuple[int, int], tuple[int, int, int] | None] = {}
+        self.shared = shared
+        self.publish_every = publish_every
+        self.published_names = (0, 0)
+        self.published_at = (self.position, self.steps)
+        if shared is not None:
+            # New segments are zero-filled, which reads as blank since the blank is interned first
+            capacity = max(shared.capacity, 2 * len(self.tape))
+            offset = (capacity - len(self.tape)) // 2
+            self.tape = shared.resize(self.tape, offset, capacity)
+            self.head += offset
+            self.origin += offset
+            self.publish()
+
+    def intern(self, symbol: str) -> int:
+        """Get the id of a tape symbol, assigning the next free one if it is new."""
+        symbol_id = self.symbol_ids.get(symbol)
+        if symbol_id is None:
+            if len(self.symbols) > 0xFF:
+                raise ValueError("Engine supports at most 256 distinct tape symbols")
+            symbol_id = self.symbol_ids[symbol] = len(self.symbols)
+            self.symbols.append(symbol)
+        return symbol_id
+
+    @property
+    def state(self) -> str:
+        """Get the name of the current state."""
+        return self.machine.states.names[self.state_id]
+
+    @property
+    def position(self) -> int:
+        """Get the number of logged transitions, i.e. how far unstep() can go back."""
+        return len(self.undo_states)
+
+    def is_halted(self) -> bool:
+        """Check if machine has halted."""
+        return self.machine.states.halting[self.state_id] == 1
+
+    def is_accepted(self) -> bool:
+        """Check if machine is in accept state."""
+        return self.machine.states.accepting[self.state_id] == 1
+
+    def _transition(self, state_id: int, symbol_id: int) -> tuple[int, int, int] | None:
+        key = (state_id, symbol_id)
+        if key in self.transitions:
+            return self.transitions[key]
+        result = self.machine.transition(state_id, self.symbols[symbol_id])
+        if result is not None:
+            if result[0] > _STATE_MASK:
+                raise ValueError("Engine supports at most 16384 states")
+            compiled = (result[0], self.intern(result[1]), 1 if result[2] == "R" else -1)
+        else:
+            compiled = None
+        self.transitions[key] = compiled
+        return compiled
+
+    def _grow(self, left: bool) -> None:
+        """Double the tape (at least 16 cells) on one side, keeping absolute positions."""
+        amount = max(len(self.tape), 16)
+        if self.shared is not None:
+            self.tape = self.shared.resize(self.tape, amount if left else 0, len(self.tape) + amount)
+        elif isinstance(self.tape, bytearray):
+            padding = bytes([self.blank_id]) * amount
+            if left:
+                self.tape[0:0] = padding
+            else:
+                self.tape.extend(padding)
+        if left:
+            self.head += amount
+            self.origin += amount
+        self.publish()
+
+    def step(self) -> bool:
+        """Execute one transition. Returns False if the machine was already halted or stuck."""
+        states = self.machine.states
+        if states.halting[self.state_id]:
+            return False
+        result = self._transition(self.state_id, self.tape[self.head])
+
+        # If delta returns None, transition to the canonical reject state
+        if result is None:
+            if states.reject_state is None:
+                return False
+            if self.record:
+                self.undo_symbols.append(self.tape[self.head])
+                self.undo_states.append(self.state_id | _STAY)
+            self.state_id = states.intern(states.reject_state)
+            return True
+
+        new_state_id, written, move = result
+        if self.record:
+            self.undo_symbols.append(self.tape[self.head])
+            self.undo_states.append(self.state_id | (_RIGHT if move > 0 else _LEFT))
+        self.tape[self.head] = written
+        self.state_id = new_state_id
+        self.steps += 1
+        self.head += move
+        if self.head < 0:
+            self._grow(left=True)
+        elif self.head >= len(self.tape):
+            self._grow(left=False)
+        return True
+
+    def unstep(self) -> bool:
+        """Undo the last logged transition. Returns False if there is nothing to undo."""
+        if not self.undo_states:
+            return False
+        entry = self.undo_states.pop()
+        symbol_id = self.undo_symbols.pop()
+        move = entry & ~_STATE_MASK
+        self.state_id = entry & _STATE_MASK
+        if move == _STAY:
+            return True
+        self.head += -1 if move == _RIGHT else 1
+        self.tape[self.head] = symbol_id
+        self.steps -= 1
+        return True
+
+    def run(self, max_steps: int | None = None) -> int:
+        """Run forward until halted or max_steps transitions were taken; returns how many."""
+        taken = 0
+        step = self.step
+        every = self.publish_every if self.shared is not None else 0
+        while max_steps is None or taken < max_steps:
+            if not step():
+                break
+            taken += 1
+            if every and taken % every == 0:
+                self.publish()
+        self.publish()
+        return taken
+
+    def run_back(self, max_steps: int | None = None) -> int:
+        """Undo up to max_steps transitions (all if None); returns how many."""
+        undone = 0
+        unstep = self.unstep
+        every = self.publish_every if self.shared is not None else 0
+        while max_steps is None or undone < max_steps:
+            if not unstep():
+                break
+            undone += 1
+            if every and undone % every == 0:
+                self.publish()
+        self.publish()
+        return undone
+
+    def seek(self, position: int) -> int:
+        """Move forward or back to a transition count; returns the position reached."""
+        if position < self.position:
+            self.run_back(self.position - position)
+        elif position > self.position:
+            self.run(position - self.position)
+        return self.position
+
+    def publish(self) -> None:
+        """Publish head, state, steps and any new symbol or state names to readers of the shared tape."""
+        if self.shared is None:
+            return
+        counts = (len(self.symbols), len(self.machine.states.names))
+        names = None
+        if counts != self.published_names:
+            names = pack_names(self.machine, self.symbols)
+            self.published_names = counts
+
+        # The head moves one cell per step; undoing retraces the logged history
+        position, steps = self.published_at
+        moved = abs(self.position - position) if self.record else abs(self.steps - steps)
+        self.published_at = (self.position, self.steps)
+        self.shared.publish(self.head, self.origin, self.state_id, self.steps, names, moved)
+
+    def close(self) -> None:
+        """Stop sharing: move the tape back into private memory and remove the shared files."""
+        if self.shared is None:
+            return
+        cells = bytearray(self.tape)
+        if isinstance(self.tape, memoryview):
+            self.tape.release()
+        self.tape = cells
+        self.shared.close()
+        self.shared = None
+
+    def config(self) -> TMConfiguration:
+        """Materialise the current state as an immutable configuration."""
+        return TMConfiguration(
+            tape=tuple(self.symbols[symbol_id] for symbol_id in self.tape),
+            head=self.head,
+            state=self.state,
+            steps=self.steps,
+            machine=self.machine,
+            origin=self.origin,
+        )
@@ -0,0 +1,197 @@
+# SPDX-License-Identifier: CC0-1.0
+
+import csv
+import io
+import math
+from collections.abc import Callable, Iterable
+from dataclasses import astuple, dataclass, fields
+from fractions import Fraction
+
+from tapeware.engine import Engine
+from tapeware.turing_machine import DeltaFunction, create_initial_config
+
+# Generates the input of size n for a family of inputs
+InputFamily = Callable[[int], str]
+
+# Input families of the example machines, keyed by module name
+FAMILIES: dict[str, InputFamily] = {
+    "anbn": lambda n: "a" * n + "b" * n,
+    "anbncn": lambda n: "a" * n + "b" * n + "c" * n,
+    "anbncn_alt": lambda n: "a" * n + "b" * n + "c" * n,
+    "end_ab": lambda n: "ab" * n,
+    "equal_01": lambda n: "0" * n + "1" * n,
+}
+
+METRICS = ("steps", "cells_visited", "tape_extent", "head_reversals")
+
+
+@dataclass(frozen=True)
+class RunMetrics:
+    """
+    Space and time used by one run.
+
+    cells_visited counts the cells the head read a symbol from; since the head
+    moves one cell per step these form a contiguous range. tape_extent spans
+    those cells together with the input. A run stays within its linear bound
+    when it only reads the input and the blank on either side of it, like a
+    linear bounded automaton with endmarkers.
+    """
+
+    n: int
+    input_length: int
+    steps: int
+    cells_visited: int
+    tape_extent: int
+    head_reversals: int
+    halted: bool
+    accepted: bool
+    within_linear_bound: bool
+
+
+@dataclass(frozen=True)
+class GrowthFit:
+    """
+    Growth of a metric as a function of n.
+
+    If some finite difference of the series is constant, degree and the exact
+    polynomial coefficients (constant term first) are set. The exponent is
+    always estimated from the slope of the last two points in log-log space.
+    """
+
+    degree: int | None
+    coefficients: tuple[Fraction, ...]
+    exponent: float
+
+    def __str__(self) -> str:
+        if self.degree is None:
+            return f"~n^{self.exponent:.2f}"
+        terms: list[str] = []
+        for power in range(len(self.coefficients) - 1, -1, -1):
+            c = self.coefficients[power]
+            if c == 0:
+                continue
+            magnitude = abs(c)
+            coefficient = "" if magnitude == 1 and power else str(magnitude)
+            variable = {0: "", 1: "n", 2: "n²", 3: "n³"}.get(power, f"n^{power}")
+            sign = "-" if c < 0 else "+"
+            terms.append(f"{sign} {coefficient}{variable}")
+        if not terms:
+            return "0"
+        formula = " ".join(terms)
+        return formula[2:] if formula.startswith("+") else "-" + formula[2:]
+
+
+def measure(input_str: str, delta: DeltaFunction, n: int = 0, max_steps: int | None = None) -> RunMetrics:
+    """Run one input on the reversible engine without its undo log, collecting metrics."""
+    engine = Engine(create_initial_config(input_str, delta), record=False)
+    low = high = engine.head - engine.origin
+    reversals = 0
+    last_move = 0
+    taken = 0
+
+    while max_steps is None or taken < max_steps:
+        position = engine.head - engine.origin
+        if not engine.step():
+            break
+        taken += 1
+        low = min(low, position)
+        high = max(high, position)
+        move = engine.head - engine.origin - position
+        if move and last_move and move != last_move:
+            reversals += 1
+        if move:
+            last_move = move
+
+    length = len(input_str)
+    return RunMetrics(
+        n=n,
+        input_length=length,
+        steps=engine.steps,
+        cells_visited=high - low + 1,
+        tape_extent=max(high, length) - min(low, 1 if length else low) + 1,
+        head_reversals=reversals,
+        halted=engine.is_halted(),
+        accepted=engine.is_accepted(),
+        within_linear_bound=low >= 0 and high <= length + 1,
+    )
+
+
+def profile(
+    delta: DeltaFunction, family: InputFamily, ns: Iterable[int], max_steps: int | None = None
+) -> list[RunMetrics]:
+    """Measure a machine on the input family for every n."""
+    return [measure(family(n), delta, n, max_steps) for n in ns]
+
+
+def fit_growth(ns: list[int], values: list[int], max_degree: int = 3) -> GrowthFit:
+    """
+    Fit the growth series of a metric.
+
+    Looks for the smallest degree whose finite difference is constant, as in the
+    README's comparison of the aⁿbⁿcⁿ machines, and solves for the exact
+    polynomial through the first degree + 1 points. ns must be evenly spaced.
+    """
+    exponent = 0.0
+    if len(ns) >= 2 and values[-1] > 0 and values[-2] > 0 and ns[-2] > 0:
+        exponent = math.log(values[-1] / values[-2]) / math.log(ns[-1] / ns[-2])
+
+    differences = list(values)
+    for degree in range(max_degree + 1):
+        # Need at least two equal differences to call the series constant
+        if len(differences) >= 2 and len(set(differences)) == 1:
+            return GrowthFit(degree, _solve_polynomial(ns[: degree + 1], values[: degree + 1]), exponent)
+        differences = [b - a for a, b in zip(differences, differences[1:])]
+    return GrowthFit(None, (), exponent)
+
+
+def _solve_polynomial(xs: list[int], ys: list[int]) -> tuple[Fraction, ...]:
+    """Solve the Vandermonde system for the polynomial through the points, exactly."""
+    size = len(xs)
+    rows = [[Fraction(x) ** power for power in range(size)] + [Fraction(y)] for x, y in zip(xs, ys)]
+    for col in range(size):
+        pivot = next(r for r in range(col, size) if rows[r][col] != 0)
+        rows[col], rows[pivot] = rows[pivot], rows[col]
+        for r in range(size):
+            if r != col and rows[r][col] != 0:
+                factor = rows[r][col] / rows[col][col]
+                rows[r] = [a - factor * b for a, b in zip(rows[r], rows[col])]
+    return tuple(rows[i][size] / rows[i][i] for i in range(size))
+
+
+def format_report(name: str, results: list[RunMetrics]) -> str:
+    """Format growth tables, fitted series and linear-bound flags as text."""
+    ns = [r.n for r in results]
+    lines = [name, "=" * len(name)]
+    for metric in METRICS:
+        values: list[int] = [getattr(r, metric) for r in results]
+        first = [b - a for a, b in zip(values, values[1:])]
+        second = [b - a for a, b in zip(first, first[1:])]
+        lines.append("")
+        lines.append(f"{metric}: {fit_growth(ns, values)}")
+        lines.append(f"{'n':>4}  {metric:>14}  {'1st diff':>9}  {'2nd diff':>9}")
+        for i, (n, value) in enumerate(zip(ns, values)):
+            d1 = str(first[i - 1]) if i >= 1 else ""
+            d2 = str(second[i - 2]) if i >= 2 else ""
+            lines.append(f"{n:>4}  {value:>14}  {d1:>9}  {d2:>9}")
+
+    lines.append("")
+    outside = [r.n for r in results if not r.within_linear_bound]
+    if outside:
+        lines.append(f"LEAVES LINEAR BOUND for n = {', '.join(map(str, outside))}")
+    else:
+        lines.append("Stays within its linear bound")
+    unhalted = [r.n for r in results if not r.halted]
+    if unhalted:
+        lines.append(f"Did not halt within the step cap for n = {', '.join(map(str, unhalted))}")
+    return "\n".join(lines)
+
+
+def format_csv(results: dict[str, list[RunMetrics]]) -> str:
+    """Format the metrics of one or more machines as CSV, one row per run."""
+    out = io.StringIO()
+    writer = csv.writer(out, lineterminator="\n")
+    writer.writerow(["machine", *(f.name for f in fields(RunMetrics))])
+    for name, runs in results.items():
+        for run in runs:
+            writer.writerow([name, *astuple(run)])
+    return out.getvalue()
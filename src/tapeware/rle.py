@@ -0,0 +1,211 @@
+# SPDX-License-Identifier: CC0-1.0
+
+import os
+from itertools import groupby
+
+from tapeware.turing_machine import TMConfiguration, _checkpointer
+
+
+class RunLengthTape:
+    """
+    Mutable tape stored as maximal runs of equal symbols.
+
+    Memory is proportional to the number of runs rather than the tape length,
+    which suits the long uniform blocks (XXXX…YYYY…) the example machines build.
+    The head is tracked as a run index and an offset into that run, so moving
+    and crossing whole runs is O(1); writing splits or merges runs as needed.
+    """
+
+    def __init__(self, tape: tuple[str, ...], head: int, blank: str, start: int = 0) -> None:
+        self.blank = blank
+        self.symbols: list[str] = []
+        self.lengths: list[int] = []
+        for symbol, group in groupby(tape or (blank,)):
+            self.symbols.append(symbol)
+            self.lengths.append(sum(1 for _ in group))
+        # Absolute position of the first stored cell and of the head
+        self.start = start
+        self.position = start + head
+        self.run = 0
+        self.offset = head
+        while self.offset >= self.lengths[self.run]:
+            self.offset -= self.lengths[self.run]
+            self.run += 1
+
+    @classmethod
+    def from_config(cls, config: TMConfiguration) -> "RunLengthTape":
+        """Build a run-length tape holding the tape and head of a configuration."""
+        return cls(config.tape, config.head, config.blank, -config.origin)
+
+    def __len__(self) -> int:
+        """Get the number of stored cells."""
+        return sum(self.lengths)
+
+    def runs(self) -> list[tuple[str, int]]:
+        """Get the stored runs as (symbol, length) pairs."""
+        return list(zip(self.symbols, self.lengths))
+
+    def cells(self) -> tuple[str, ...]:
+        """Expand the runs into a plain tuple tape."""
+        return tuple(symbol for symbol, length in zip(self.symbols, self.lengths) for _ in range(length))
+
+    def read(self) -> str:
+        """Get symbol under head."""
+        return self.symbols[self.run]
+
+    def write(self, symbol: str) -> None:
+        """Write symbol under the head, splitting and merging runs as needed."""
+        i, old = self.run, self.symbols[self.run]
+        if old == symbol:
+            return
+        left = self.offset
+        right = self.lengths[i] - left - 1
+
+        symbols: list[str] = []
+        lengths: list[int] = []
+        if left:
+            symbols.append(old)
+            lengths.append(left)
+        symbols.append(symbol)
+        lengths.append(1)
+        if right:
+            symbols.append(old)
+            lengths.append(right)
+        self.symbols[i : i + 1] = symbols
+        self.lengths[i : i + 1] = lengths
+        self.run = i = i + (1 if left else 0)
+        self.offset = 0
+
+        if not right and i + 1 < len(self.symbols) and self.symbols[i + 1] == symbol:
+            self.lengths[i] += self.lengths.pop(i + 1)
+            del self.symbols[i + 1]
+        if not left and i > 0 and self.symbols[i - 1] == symbol:
+            self.offset = self.lengths[i - 1]
+            self.lengths[i - 1] += self.lengths.pop(i)
+            del self.symbols[i]
+            self.run = i - 1
+
+    def move(self, direction: str) -> None:
+        """Move the head one cell, growing the tape with blanks at either end."""
+        if direction == "R":
+            self.position += 1
+            if self.offset < self.lengths[self.run] - 1:
+                self.offset += 1
+            elif self.run < len(self.lengths) - 1:
+                self.run += 1
+                self.offset = 0
+            elif self.symbols[-1] == self.blank:
+                self.lengths[-1] += 1
+                self.offset += 1
+            else:
+                self.symbols.append(self.blank)
+                self.lengths.append(1)
+                self.run += 1
+                self.offset = 0
+        else:
+            self.position -= 1
+            if self.offset > 0:
+                self.offset -= 1
+            elif self.run > 0:
+                self.run -= 1
+                self.offset = self.lengths[self.run] - 1
+            else:
+                if self.symbols[0] == self.blank:
+                    self.lengths[0] += 1
+                else:
+                    self.symbols.insert(0, self.blank)
+                    self.lengths.insert(0, 1)
+                self.start -= 1
+
+    def sweep(self, direction: str, limit: int | None = None) -> int:
+        """
+        Move the head across the rest of the current run in one operation.
+
+        Equivalent to repeatedly rewriting the symbol under the head and moving
+        in direction, at most limit times. Returns the number of cells crossed.
+        """
+        if direction == "R":
+            remaining = self.lengths[self.run] - self.offset
+        else:
+            remaining = self.offset + 1
+        if limit is not None and limit < remaining:
+            self.offset += limit if direction == "R" else -limit
+            self.position += limit if direction == "R" else -limit
+            return limit
+
+        # Stop on the last cell of the run, then step off it normally
+        self.offset = self.lengths[self.run] - 1 if direction == "R" else 0
+        self.position += remaining - 1 if direction == "R" else 1 - remaining
+        self.move(direction)
+        return remaining
+
+
+def run_rle(
+    config: TMConfiguration,
+    max_steps: int | None = None,
+    checkpoint_every: int | None = None,
+    checkpoint_path: str | os.PathLike[str] | None = None,
+) -> TMConfiguration:
+    """
+    Run TM until it halts on a run-length encoded tape.
+
+    Self-loops that rewrite the symbol they read (the sweeps reported by
+    tapeware.analysis) cross a whole run of that symbol in a single operation,
+    while still counting one step per cell. Produces the same final
+    configuration as run_until_halt.
+    """
+    checkpoint = _checkpointer(checkpoint_every, checkpoint_path)
+    tape = RunLengthTape.from_config(config)
+    machine = config.machine
+    states = machine.states
+    halting = states.halting
+    transition = machine.transition
+    state_id = config.state_id
+    steps = config.steps
+    taken = 0
+
+    while not halting[state_id]:
+        if max_steps is not None and taken >= max_steps:
+            break
+        symbol = tape.read()
+        result = transition(state_id, symbol)
+
+        # If delta returns None, transition to reject state without a step
+        if result is None:
+            if states.reject_state is None:
+                break
+            state_id = states.intern(states.reject_state)
+            crossed = 0
+            taken += 1
+        elif result[0] == state_id and result[1] == symbol:
+            direction = result[2]
+            limit = None if max_steps is None else max_steps - taken
+            if checkpoint_every is not None:
+                until_checkpoint = checkpoint_every - steps % checkpoint_every
+                limit = until_checkpoint if limit is None else min(limit, until_checkpoint)
+            crossed = tape.sweep(direction, limit)
+        else:
+            state_id, written, direction = result
+            tape.write(written)
+            tape.move(direction)
+            crossed = 1
+        steps += crossed
+        taken += crossed
+
+        # Only materialise the tape when a checkpoint is actually due
+        if checkpoint is not None and checkpoint_every is not None and steps % checkpoint_every == 0:
+            checkpoint(_to_config(config, tape, states.names[state_id], steps))
+
+    return _to_config(config, tape, states.names[state_id], steps)
+
+
+def _to_config(config: TMConfiguration, tape: RunLengthTape, state: str, steps: int) -> TMConfiguration:
+    """Materialise a run-length tape back into an immutable configuration."""
+    return TMConfiguration(
+        tape=tape.cells(),
+        head=tape.position - tape.start,
+        state=state,
+        steps=steps,
+        machine=config.machine,
+        origin=-tape.start,
+    )
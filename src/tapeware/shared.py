@@ -0,0 +1,385 @@
+# SPDX-License-Identifier: CC0-1.0
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from dataclasses import dataclass
+
+from tapeware.snapshot import _pack_str, _pack_strs, _Reader, machine_reference, resolve_machine
+from tapeware.turing_machine import DeltaFunction, TMConfiguration, TuringMachine
+
+_MAGIC = b"TWSH"
+_VERSION = 1
+
+# magic, version, sequence, generation, capacity, head, origin, state id, steps, names length
+_HEADER = struct.Struct("<4sB3xQQQqqQQI")
+_SEQUENCE_OFFSET = 8
+# Set in the padding after the version once the writer closed the tape
+_CLOSED_OFFSET = 5
+
+# How long readers wait for a publish in progress or a new segment before giving up
+RETRY_SECONDS = 1.0
+
+# Size of the control file: header followed by the machine definition and names
+CONTROL_SIZE = 1 << 20
+
+# Initial number of tape cells
+DEFAULT_CAPACITY = 1 << 16
+
+
+def _segment_path(path: str, generation: int) -> str:
+    return f"{path}.{generation}"
+
+
+def _map_file(path: str, size: int) -> mmap.mmap:
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o600)
+    try:
+        os.ftruncate(fd, size)
+        return mmap.mmap(fd, size)
+    finally:
+        os.close(fd)
+
+
+def _map_file_read_only(path: str) -> mmap.mmap:
+    with open(path, "rb") as file:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+class SharedTape:
+    """
+    Writer side of a tape shared with other processes through memory-mapped files.
+
+    A control file holds a header (head, origin, state id, steps and the
+    generation of the tape segment) and the machine definition with the
+    symbol and state names. The cells live in a separate segment file,
+    path.<generation>, that an Engine reads and writes in place. Segments
+    have a fixed capacity, so growing the tape creates the next generation
+    and readers follow it through the header.
+
+    The first half of a segment holds the live cells, which run ahead of the
+    header between publishes. publish() copies them into the second half
+    and writes the header under a sequence lock, so readers can take a
+    snapshot of cells and header as they were at that publish. Files are
+    created in /dev/shm where available, so nothing hits the disk.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] | None = None, capacity: int = DEFAULT_CAPACITY) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if path is None:
+            directory = "/dev/shm" if os.path.isdir("/dev/shm") else None
+            fd, self.path = tempfile.mkstemp(prefix="tapeware-", dir=directory)
+            os.close(fd)
+        else:
+            self.path = os.fspath(path)
+        self.capacity = capacity
+        self.generation = -1
+        self.sequence = 0
+        self.names_length = 0
+        self.control = _map_file(self.path, CONTROL_SIZE)
+        self.cells: mmap.mmap | None = None
+        self.stale: list[str] = []
+        self.published_head = 0
+        self.copy_all = True
+        _HEADER.pack_into(self.control, 0, _MAGIC, _VERSION, 0, 0, 0, 0, 0, 0, 0, 0)
+
+    def resize(self, cells: bytearray | memoryview, offset: int, capacity: int) -> memoryview:
+        """
+        Move the cells into a new segment of the given capacity, starting at offset.
+
+        Returns a writable view of the live cells of the new segment; the view
+        passed in is released. Unused cells are zero, which must be the blank
+        symbol id. The new generation becomes visible to readers on the next
+        publish().
+        """
+        generation = self.generation + 1
+        segment = _map_file(_segment_path(self.path, generation), 2 * capacity)
+        segment[offset : offset + len(cells)] = cells
+        if isinstance(cells, memoryview):
+            cells.release()
+        if self.cells is not None:
+            self.cells.close()
+            self.stale.append(_segment_path(self.path, self.generation))
+        self.cells = segment
+        self.generation = generation
+        self.capacity = capacity
+        self.copy_all = True
+        view = memoryview(segment)
+        live = view[:capacity]
+        view.release()
+        return live
+
+    def publish(
+        self,
+        head: int,
+        origin: int,
+        state_id: int,
+        steps: int,
+        names: bytes | None = None,
+        moved: int | None = None,
+    ) -> None:
+        """
+        Copy the live cells and write the header, and the names if they changed, under the sequence lock.
+
+        moved bounds how far the head went since the last publish, so only the
+        cells within that distance of the last published head are copied;
+        None copies them all.
+        """
+        if names is not None and _HEADER.size + len(names) > CONTROL_SIZE:
+            raise ValueError("Too many symbols and states to share")
+
+        # An odd sequence tells readers a write is in progress
+        self.sequence += 1
+        if names is not None:
+            self.names_length = len(names)
+        _HEADER.pack_into(
+            self.control,
+            0,
+            _MAGIC,
+            _VERSION,
+            self.sequence,
+            self.generation,
+            self.capacity,
+            head,
+            origin,
+            state_id,
+            steps,
+            self.names_length,
+        )
+        if names is not None:
+            self.control[_HEADER.size : _HEADER.size + len(names)] = names
+        if self.cells is not None:
+            start, end = 0, self.capacity
+            if moved is not None and not self.copy_all:
+                start = max(self.published_head - moved, 0)
+                end = min(self.published_head + moved + 1, self.capacity)
+            self.cells[self.capacity + start : self.capacity + end] = self.cells[start:end]
+            self.copy_all = False
+        self.published_head = head
+        self.sequence += 1
+        struct.pack_into("<Q", self.control, _SEQUENCE_OFFSET, self.sequence)
+
+        # Old segments go only once readers can find the new generation
+        for path in self.stale:
+            os.unlink(path)
+        self.stale.clear()
+
+    def close(self) -> None:
+        """Mark the tape closed for readers, then unmap and remove the control file and segments."""
+        self.control[_CLOSED_OFFSET] = 1
+        if self.cells is not None:
+            self.cells.close()
+            self.stale.append(_segment_path(self.path, self.generation))
+            self.cells = None
+        self.control.close()
+        for path in [*self.stale, self.path]:
+            if os.path.exists(path):
+                os.unlink(path)
+        self.stale.clear()
+
+
+def pack_names(machine: TuringMachine, symbols: list[str]) -> bytes:
+    """Pack the machine definition and the symbol and state names for the control file."""
+    return b"".join(
+        (
+            _pack_str(machine_reference(machine.delta)),
+            _pack_str(machine.initial_state),
+            _pack_str(machine.blank),
+            _pack_strs(sorted(machine.accept_states)),
+            _pack_strs(sorted(machine.reject_states)),
+            _pack_strs(symbols),
+            _pack_strs(machine.states.names),
+        )
+    )
+
+
+@dataclass(frozen=True)
+class SharedSnapshot:
+    """Copy of a shared tape as of one publish: the header fields, names and cells."""
+
+    generation: int
+    head: int
+    origin: int
+    state_id: int
+    steps: int
+    reference: str
+    initial_state: str
+    blank: str
+    accept_states: tuple[str, ...]
+    reject_states: tuple[str, ...]
+    symbols: tuple[str, ...]
+    states: tuple[str, ...]
+    cells: bytes
+
+    @property
+    def state(self) -> str:
+        """Get the name of the current state."""
+        return self.states[self.state_id]
+
+    def config(self, delta: DeltaFunction | None = None) -> TMConfiguration:
+        """
+        Materialise the snapshot as a configuration, trimmed to its non-blank cells.
+
+        The delta function is imported from the published reference unless
+        given, like tapeware.snapshot.loads does.
+        """
+        machine = TuringMachine(
+            delta if delta is not None else resolve_machine(self.reference),
+            self.initial_state,
+            set(self.accept_states),
+            set(self.reject_states),
+            self.blank,
+        )
+        start = min(len(self.cells) - len(self.cells.lstrip(b"\0")), self.head)
+        end = max(len(self.cells.rstrip(b"\0")), self.head + 1)
+        return TMConfiguration(
+            tape=tuple(self.symbols[symbol_id] for symbol_id in self.cells[start:end]),
+            head=self.head - start,
+            state=self.state,
+            steps=self.steps,
+            machine=machine,
+            origin=self.origin - start,
+        )
+
+
+class SharedTapeView:
+    """
+    Read-only view of a tape shared by an Engine in another process.
+
+    Attach by the path of the control file (SharedTape.path). cells is a
+    zero-copy view of the live tape; head, state_id and steps are the values
+    last published by the writer, so the live cells may be up to
+    publish_every steps ahead of them. snapshot() copies the cells as they
+    were at the last publish together with the header, so they match.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self.control = _map_file_read_only(self.path)
+        if len(self.control) < CONTROL_SIZE or self.control[:4] != _MAGIC:
+            self.control.close()
+            raise ValueError(f"{self.path} is not a tapeware shared tape")
+        if self.control[4] != _VERSION:
+            self.control.close()
+            raise ValueError(f"Unsupported shared tape version {self.control[4]}")
+        self.generation = -1
+        self.segment: mmap.mmap | None = None
+        try:
+            self.refresh()
+        except (ValueError, TimeoutError):
+            self.control.close()
+            raise
+
+    def __enter__(self) -> "SharedTapeView":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _wait(self, deadline: float, waiting_for: str) -> None:
+        """Yield before retrying, raising if the writer closed the tape or the deadline passed."""
+        if self.control[_CLOSED_OFFSET]:
+            raise ValueError(f"Shared tape {self.path} was closed")
+        if time.monotonic() > deadline:
+            raise TimeoutError(f"Gave up waiting for {waiting_for} of shared tape {self.path}")
+        time.sleep(0)
+
+    def _header(self) -> tuple[int, ...]:
+        """Read the header under the sequence lock."""
+        deadline = time.monotonic() + RETRY_SECONDS
+        while True:
+            if self.control[_CLOSED_OFFSET]:
+                raise ValueError(f"Shared tape {self.path} was closed")
+            header = _HEADER.unpack_from(self.control, 0)
+            sequence = header[2]
+            if sequence % 2 == 0 and struct.unpack_from("<Q", self.control, _SEQUENCE_OFFSET)[0] == sequence:
+                return header[2:]
+            self._wait(deadline, "a publish")
+
+    def refresh(self) -> bool:
+        """
+        Attach to the current tape segment if the writer grew the tape. Returns True if it did.
+
+        Raises ValueError once the writer closed the tape, and TimeoutError if
+        the segment of the published generation does not show up in time.
+        """
+        deadline = time.monotonic() + RETRY_SECONDS
+        while True:
+            generation = self._header()[1]
+            if generation == self.generation:
+                return False
+            try:
+                segment = _map_file_read_only(_segment_path(self.path, generation))
+            except FileNotFoundError:
+                # The writer has not created it yet, already replaced it or closed the tape
+                self._wait(deadline, f"segment {generation}")
+                continue
+            self.segment = segment
+            self.generation = generation
+            return True
+
+    @property
+    def cells(self) -> memoryview:
+        """Get a read-only, zero-copy view of the live tape cells (symbol ids)."""
+        self.refresh()
+        assert self.segment is not None
+        view = memoryview(self.segment)
+        live = view[: len(self.segment) // 2]
+        view.release()
+        return live
+
+    @property
+    def head(self) -> int:
+        """Get the published head index into cells."""
+        return self._header()[3]
+
+    @property
+    def state_id(self) -> int:
+        """Get the published state id."""
+        return self._header()[5]
+
+    @property
+    def steps(self) -> int:
+        """Get the published step count."""
+        return self._header()[6]
+
+    def snapshot(self) -> SharedSnapshot:
+        """Copy the header, names and published cells, retrying until no publish happened in between."""
+        deadline = time.monotonic() + RETRY_SECONDS
+        while True:
+            self.refresh()
+            sequence, generation, _, head, origin, state_id, steps, names_length = self._header()
+            if generation != self.generation:
+                self._wait(deadline, "a consistent snapshot")
+                continue
+            assert self.segment is not None
+            names = self.control[_HEADER.size : _HEADER.size + names_length]
+            cells = self.segment[len(self.segment) // 2 :]
+            if struct.unpack_from("<Q", self.control, _SEQUENCE_OFFSET)[0] != sequence:
+                self._wait(deadline, "a consistent snapshot")
+                continue
+            reader = _Reader(names, 0)
+            return SharedSnapshot(
+                generation,
+                head,
+                origin,
+                state_id,
+                steps,
+                reader.str(),
+                reader.str(),
+                reader.str(),
+                tuple(reader.strs()),
+                tuple(reader.strs()),
+                tuple(reader.strs()),
+                tuple(reader.strs()),
+                cells,
+            )
+
+    def close(self) -> None:
+        """Unmap the control file and tape segment. Views from cells must be released first."""
+        if self.segment is not None:
+            self.segment.close()
+            self.segment = None
+        self.control.close()
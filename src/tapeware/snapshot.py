@@ -0,0 +1,231 @@
+# SPDX-License-Identifier: CC0-1.0
+
+import hashlib
+import importlib
+import os
+import struct
+import zlib
+from collections.abc import Iterator
+from types import CodeType
+
+from tapeware.turing_machine import DeltaFunction, TMConfiguration, TuringMachine
+
+# Binary snapshot layout (all integers little-endian):
+#
+#   magic "TWSN" | format version u8
+#   head i64 | steps u64 | origin i64
+#   state, initial state, blank, machine reference: length-prefixed UTF-8 strings
+#   fingerprint: u8 length + raw digest (empty if the delta has no code object)
+#   accept states, reject states, alphabet: u16 count + length-prefixed strings
+#   cell width u8 | tape length u64 | u32 length + zlib-compressed cell ids
+MAGIC = b"TWSN"
+FORMAT_VERSION = 1
+
+_HEADER = struct.Struct("<4sBqQq")
+
+
+def machine_reference(delta: DeltaFunction) -> str:
+    """Return the importable 'module:qualname' reference of a delta function."""
+    module = getattr(delta, "__module__", None) or ""
+    qualname = getattr(delta, "__qualname__", None) or ""
+    return f"{module}:{qualname}"
+
+
+def _const_repr(const: object) -> str:
+    """repr of a code constant that does not depend on the hash seed."""
+    if isinstance(const, frozenset | set):
+        return f"frozenset({{{', '.join(sorted(_const_repr(item) for item in const))}}})"
+    if isinstance(const, tuple):
+        return f"({', '.join(_const_repr(item) for item in const)},)"
+    return repr(const)
+
+
+def _code_parts(code: CodeType) -> Iterator[bytes]:
+    yield code.co_code
+    yield repr(code.co_names).encode()
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            yield from _code_parts(const)
+        else:
+            yield _const_repr(const).encode()
+
+
+def machine_fingerprint(delta: DeltaFunction) -> bytes:
+    """
+    Fingerprint the behaviour of a delta function.
+
+    Hashes the bytecode, names and constants of the function, so moving it to
+    another file keeps the fingerprint while editing its transitions changes it.
+    Returns an empty digest for callables without a code object.
+    """
+    code = getattr(delta, "__code__", None)
+    if code is None:
+        return b""
+    digest = hashlib.sha256()
+    for part in _code_parts(code):
+        digest.update(part)
+    return digest.digest()
+
+
+def resolve_machine(reference: str) -> DeltaFunction:
+    """Import the delta function named by a 'module:qualname' reference."""
+    module_name, _, qualname = reference.partition(":")
+    if not module_name or not qualname or "<locals>" in qualname:
+        raise ValueError(f"Machine reference {reference!r} cannot be imported, pass the delta explicitly")
+    obj = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        obj = getattr(obj, attr)
+    return obj
+
+
+def _pack_str(value: str) -> bytes:
+    raw = value.encode("utf-8")
+    return struct.pack("<H", len(raw)) + raw
+
+
+def _pack_strs(values: list[str]) -> bytes:
+    return struct.pack("<H", len(values)) + b"".join(_pack_str(v) for v in values)
+
+
+class _Reader:
+    def __init__(self, data: bytes, offset: int) -> None:
+        self.data = data
+        self.offset = offset
+
+    def unpack(self, fmt: str) -> tuple[int, ...]:
+        try:
+            values = struct.unpack_from(fmt, self.data, self.offset)
+        except struct.error:
+            raise ValueError("Truncated snapshot") from None
+        self.offset += struct.calcsize(fmt)
+        return values
+
+    def raw(self, length: int) -> bytes:
+        chunk = self.data[self.offset : self.offset + length]
+        if len(chunk) != length:
+            raise ValueError("Truncated snapshot")
+        self.offset += length
+        return chunk
+
+    def str(self) -> str:
+        (length,) = self.unpack("<H")
+        try:
+            return self.raw(length).decode("utf-8")
+        except UnicodeDecodeError:
+            raise ValueError("Corrupt snapshot string") from None
+
+    def strs(self) -> list[str]:
+        (count,) = self.unpack("<H")
+        return [self.str() for _ in range(count)]
+
+
+def dumps(config: TMConfiguration) -> bytes:
+    """
+    Serialise a configuration to a compact binary snapshot.
+
+    The tape is stored as one or two bytes per cell indexing a symbol table, then
+    zlib-compressed, so long blank or uniform regions cost almost nothing.
+    The machine is stored by reference and fingerprint, never by value.
+    """
+    alphabet = sorted(set(config.tape))
+    if len(alphabet) > 0xFFFF:
+        raise ValueError("Tape alphabet too large for snapshot")
+    width = 1 if len(alphabet) <= 0xFF else 2
+    index = {symbol: i for i, symbol in enumerate(alphabet)}
+    cells = [index[symbol] for symbol in config.tape]
+    packed = bytes(cells) if width == 1 else struct.pack(f"<{len(cells)}H", *cells)
+    compressed = zlib.compress(packed, 1)
+    fingerprint = machine_fingerprint(config.delta)
+
+    return b"".join(
+        [
+            _HEADER.pack(MAGIC, FORMAT_VERSION, config.head, config.steps, config.origin),
+            _pack_str(config.state),
+            _pack_str(config.machine.initial_state),
+            _pack_str(config.blank),
+            _pack_str(machine_reference(config.delta)),
+            struct.pack("<B", len(fingerprint)) + fingerprint,
+            _pack_strs(sorted(config.accept_states)),
+            _pack_strs(sorted(config.reject_states)),
+            _pack_strs(alphabet),
+            struct.pack("<BQI", width, len(cells), len(compressed)),
+            compressed,
+        ]
+    )
+
+
+def loads(data: bytes, delta: DeltaFunction | None = None) -> TMConfiguration:
+    """
+    Restore a configuration from a binary snapshot.
+
+    Without an explicit delta the machine is imported by its stored reference.
+    Raises ValueError if the snapshot is malformed or the machine's fingerprint
+    no longer matches the one the snapshot was taken with.
+    """
+    if len(data) < _HEADER.size:
+        raise ValueError("Truncated snapshot")
+    magic, version, head, steps, origin = _HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("Not a tapeware snapshot")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported snapshot format version {version}")
+
+    reader = _Reader(data, _HEADER.size)
+    state = reader.str()
+    initial_state = reader.str()
+    blank = reader.str()
+    reference = reader.str()
+    (fingerprint_length,) = reader.unpack("<B")
+    fingerprint = reader.raw(fingerprint_length)
+    accept_states = reader.strs()
+    reject_states = reader.strs()
+    alphabet = reader.strs()
+    width, length, compressed_length = reader.unpack("<BQI")
+    try:
+        packed = zlib.decompress(reader.raw(compressed_length))
+    except zlib.error:
+        raise ValueError("Corrupt snapshot tape") from None
+
+    if delta is None:
+        delta = resolve_machine(reference)
+    if fingerprint and machine_fingerprint(delta) != fingerprint:
+        raise ValueError(f"Machine {reference!r} changed since the snapshot was taken")
+
+    if width not in (1, 2) or len(packed) != length * width:
+        raise ValueError("Corrupt snapshot tape")
+    cells = packed if width == 1 else struct.unpack(f"<{length}H", packed)
+    if cells and max(cells) >= len(alphabet):
+        raise ValueError("Corrupt snapshot tape")
+    if not 0 <= head < length:
+        raise ValueError(f"Snapshot head {head} is outside its tape of {length} cells")
+
+    machine = TuringMachine(delta, initial_state, set(accept_states), set(reject_states), blank)
+    return TMConfiguration(
+        tape=tuple(alphabet[cell] for cell in cells),
+        head=head,
+        state=state,
+        steps=steps,
+        machine=machine,
+        origin=origin,
+    )
+
+
+def save_checkpoint(config: TMConfiguration, path: str | os.PathLike[str]) -> None:
+    """
+    Write a snapshot to disk atomically.
+
+    The snapshot goes to a temporary file first and is moved into place, so a
+    crash mid-write leaves the previous checkpoint intact.
+    """
+    tmp_path = f"{os.fspath(path)}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(dumps(config))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path: str | os.PathLike[str], delta: DeltaFunction | None = None) -> TMConfiguration:
+    """Read a snapshot written by save_checkpoint."""
+    with open(path, "rb") as f:
+        return loads(f.read(), delta)
@@ -1,45 +1,323 @@
 # SPDX-License-Identifier: CC0-1.0
 
-from typing import Callable
-from dataclasses import dataclass, replace
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Callable, Literal
+from dataclasses import dataclass, field, replace
+import hashlib
+import os
 import time
 from termcolor import colored
 
+if TYPE_CHECKING:
+    from tapeware.analysis import MachineReport
+
 # Type alias for a delta function
 DeltaFunction = Callable[[str, str], tuple[str, str, str] | None]
 
 
-@dataclass(frozen=True)
+_MASK64 = (1 << 64) - 1
+_symbol_keys: dict[str, int] = {}
+
+
+def _symbol_key(symbol: str) -> int:
+    """Stable 64-bit key of a symbol, independent of the interpreter's hash seed."""
+    key = _symbol_keys.get(symbol)
+    if key is None:
+        key = int.from_bytes(hashlib.blake2b(symbol.encode(), digest_size=8).digest(), "little")
+        _symbol_keys[symbol] = key
+    return key
+
+
+def zobrist(symbol: str, position: int, blank: str) -> int:
+    """
+    Zobrist key of a symbol at an absolute tape position.
+
+    Blanks map to 0, so a tape's hash does not depend on how much blank padding
+    surrounds its content.
+    """
+    if symbol == blank:
+        return 0
+    # splitmix64 finaliser over the symbol key and position
+    z = (_symbol_key(symbol) + position * 0x9E3779B97F4A7C15) & _MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def tape_hash(tape: tuple[str, ...], blank: str, origin: int = 0) -> int:
+    """Hash a whole tape from scratch; step() maintains it incrementally instead."""
+    h = 0
+    for i, symbol in enumerate(tape):
+        if symbol != blank:
+            h ^= zobrist(symbol, i - origin, blank)
+    return h
+
+
+class StateIndex:
+    """
+    Interned states of a machine with precomputed halting flags.
+
+    Every state gets a small integer id on first sight, so checking whether a
+    state halts or accepts is an array lookup. Accept and reject states are
+    interned first in sorted order and the canonical reject target is the
+    smallest reject state, so ids and outcomes do not depend on set iteration
+    order or the interpreter's hash seed.
+    """
+
+    def __init__(self, accept_states: frozenset[str], reject_states: frozenset[str]) -> None:
+        self.ids: dict[str, int] = {}
+        self.names: list[str] = []
+        self.halting = bytearray()
+        self.accepting = bytearray()
+        self.accept_states = accept_states
+        self.reject_states = reject_states
+        self.reject_state = min(reject_states) if reject_states else None
+        for state in sorted(accept_states) + sorted(reject_states):
+            self.intern(state)
+
+    def intern(self, state: str) -> int:
+        """Get the id of a state, assigning the next free one if it is new."""
+        state_id = self.ids.get(state)
+        if state_id is None:
+            state_id = self.ids[state] = len(self.names)
+            self.names.append(state)
+            self.accepting.append(state in self.accept_states)
+            self.halting.append(state in self.accept_states or state in self.reject_states)
+        return state_id
+
+
+@dataclass(frozen=True, slots=True, eq=False)
 class TMConfiguration:
     """
     Immutable Turing Machine configuration.
 
     Represents the complete state of a TM at a single point in time.
     All fields are immutable to support functional programming style.
+    The static definition (delta, blank, halting states) lives in the shared
+    machine, so a configuration is only a small slotted record.
+
+    origin is the tape index of absolute position 0; it grows whenever the tape
+    is extended to the left. tape_hash is a Zobrist hash of the non-blank cells
+    at their absolute positions, so hashing is O(1) and equality only compares
+    tapes when the cheap fields already agree. Two configurations that differ
+    only in blank padding are equal.
     """
 
     tape: tuple[str, ...]
     head: int
     state: str
     steps: int
-    blank: str
-    delta: DeltaFunction
-    accept_states: frozenset[str]
-    reject_states: frozenset[str]
+    machine: "TuringMachine"
+    origin: int = 0
+    tape_hash: int = field(init=False, repr=False)
+    state_id: int = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tape_hash", tape_hash(self.tape, self.machine.blank, self.origin))
+        object.__setattr__(self, "state_id", self.machine.states.intern(self.state))
+
+    def __hash__(self) -> int:
+        return hash((self.tape_hash, self.head - self.origin, self.state, self.steps))
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, TMConfiguration):
+            return NotImplemented
+        if (
+            self.tape_hash != other.tape_hash
+            or self.head - self.origin != other.head - other.origin
+            or self.state != other.state
+            or self.steps != other.steps
+            or self.machine != other.machine
+        ):
+            return False
+        return self.content() == other.content()
+
+    @property
+    def delta(self) -> DeltaFunction:
+        """Get the delta function of the machine."""
+        return self.machine.delta
+
+    @property
+    def blank(self) -> str:
+        """Get the blank symbol of the machine."""
+        return self.machine.blank
+
+    @property
+    def accept_states(self) -> frozenset[str]:
+        """Get the accept states of the machine."""
+        return self.machine.accept_states
+
+    @property
+    def reject_states(self) -> frozenset[str]:
+        """Get the reject states of the machine."""
+        return self.machine.reject_states
+
+    def content(self) -> tuple[int, tuple[str, ...]]:
+        """Get the non-blank part of the tape and the absolute position it starts at."""
+        tape, blank = self.tape, self.machine.blank
+        start, end = 0, len(tape)
+        while start < end and tape[start] == blank:
+            start += 1
+        if start == end:
+            return 0, ()
+        while tape[end - 1] == blank:
+            end -= 1
+        return start - self.origin, tape[start:end]
 
     def is_halted(self) -> bool:
         """Check if machine has halted."""
-        return self.state in self.accept_states or self.state in self.reject_states
+        return self.machine.states.halting[self.state_id] == 1
 
     def is_accepted(self) -> bool:
         """Check if machine is in accept state."""
-        return self.state in self.accept_states
+        return self.machine.states.accepting[self.state_id] == 1
 
     def current_symbol(self) -> str:
         """Get symbol under head."""
         return self.tape[self.head]
 
 
+class TuringMachine:
+    """
+    Static definition of a Turing machine.
+
+    Owns everything that does not change from step to step: the delta
+    function, blank symbol and halting states, the interned state index, a
+    cache of compiled transitions and the analysis reports per input alphabet.
+    Configurations reference their machine instead of copying all of this.
+    Delta functions are assumed to be pure, so their results are cached.
+    """
+
+    def __init__(
+        self,
+        delta_function: DeltaFunction,
+        initial_state: str = "q₀",
+        accept_states: set[str] | frozenset[str] | None = None,
+        reject_states: set[str] | frozenset[str] | None = None,
+        blank_symbol: str = "□",
+    ) -> None:
+        self.delta = delta_function
+        self.initial_state = initial_state
+        self.blank = blank_symbol
+        self.accept_states = frozenset(accept_states or {"qₐ"})
+        self.reject_states = frozenset(reject_states or {"qᵣ"})
+        self.states = StateIndex(self.accept_states, self.reject_states)
+        self.transitions: dict[tuple[int, str], tuple[int, str, str] | None] = {}
+        self.reports: "dict[frozenset[str], MachineReport]" = {}
+
+    def definition(self) -> tuple[DeltaFunction, str, str, frozenset[str], frozenset[str]]:
+        """Get the fields that define the machine, used for equality."""
+        return (self.delta, self.initial_state, self.blank, self.accept_states, self.reject_states)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, TuringMachine):
+            return NotImplemented
+        return self.definition() == other.definition()
+
+    def __hash__(self) -> int:
+        return hash(self.definition())
+
+    def __repr__(self) -> str:
+        name = getattr(self.delta, "__qualname__", repr(self.delta))
+        return f"TuringMachine({name}, initial_state={self.initial_state!r})"
+
+    def initial_config(self, input_string: str) -> TMConfiguration:
+        """Create the initial configuration for an input, head on its first symbol."""
+        tape = tuple([self.blank] + list(input_string) + [self.blank] * 10)
+        return TMConfiguration(tape=tape, head=1, state=self.initial_state, steps=0, machine=self)
+
+    def transition(self, state_id: int, symbol: str) -> tuple[int, str, str] | None:
+        """Get the compiled transition (new state id, symbol to write, direction), cached per machine."""
+        key = (state_id, symbol)
+        try:
+            return self.transitions[key]
+        except KeyError:
+            pass
+        result = self.delta(self.states.names[state_id], symbol)
+        compiled = None if result is None else (self.states.intern(result[0]), result[1], result[2])
+        self.transitions[key] = compiled
+        return compiled
+
+    def step(self, config: TMConfiguration) -> TMConfiguration:
+        """
+        Execute one step of the TM.
+
+        Takes a configuration and returns a new configuration after one transition.
+        Does not mutate the input configuration.
+        """
+        # If halted, return same configuration
+        if self.states.halting[config.state_id]:
+            return config
+
+        # Get current symbol and apply the (cached) delta function
+        current_symbol = config.tape[config.head]
+        result = self.transition(config.state_id, current_symbol)
+
+        # If delta returns None, transition to the canonical reject state
+        if result is None:
+            if self.states.reject_state is not None:
+                return replace(config, state=self.states.reject_state)
+            return config
+
+        new_state_id, write_symbol_val, direction = result
+
+        # Write to tape, updating the hash with the overwritten and written symbols
+        new_tape = write_symbol(config.tape, config.head, write_symbol_val)
+        position = config.head - config.origin
+        new_hash = (
+            config.tape_hash
+            ^ zobrist(current_symbol, position, self.blank)
+            ^ zobrist(write_symbol_val, position, self.blank)
+        )
+        new_origin = config.origin
+
+        # Calculate new head position
+        new_head = config.head + (1 if direction == "R" else -1)
+
+        # Extend tape if needed
+        if new_head >= len(new_tape):
+            new_tape = extend_tape_right(new_tape, self.blank)
+        elif new_head < 0:
+            new_tape = extend_tape_left(new_tape, self.blank)
+            new_head += 10
+            new_origin += 10
+
+        # Build the successor directly: __post_init__ would rehash the whole tape
+        successor = object.__new__(TMConfiguration)
+        set_field = object.__setattr__
+        set_field(successor, "tape", new_tape)
+        set_field(successor, "head", new_head)
+        set_field(successor, "state", self.states.names[new_state_id])
+        set_field(successor, "steps", config.steps + 1)
+        set_field(successor, "machine", self)
+        set_field(successor, "origin", new_origin)
+        set_field(successor, "tape_hash", new_hash)
+        set_field(successor, "state_id", new_state_id)
+        return successor
+
+    def analyse(self, input_alphabet: Iterable[str]) -> "MachineReport":
+        """
+        Run the static analysis of tapeware.analysis once per input alphabet and keep its report.
+
+        The report lists unreachable states, dead transitions, equivalent states
+        and sweep loops of the machine over the given input alphabet.
+        """
+        alphabet = frozenset(input_alphabet)
+        report = self.reports.get(alphabet)
+        if report is None:
+            # Imported lazily: the analysis module depends on this one
+            from tapeware.analysis import analyse, tabulate
+
+            accept, reject = set(self.accept_states), set(self.reject_states)
+            table = tabulate(self.delta, sorted(alphabet), self.initial_state, accept, reject, self.blank)
+            report = self.reports[alphabet] = analyse(table, self.initial_state, accept, reject)
+        return report
+
+
 def create_initial_config(
     input_string: str,
     delta_function: DeltaFunction,
@@ -51,21 +329,11 @@ def create_initial_config(
     """
     Create initial TM configuration from input.
 
+    Thin wrapper around TuringMachine(...).initial_config(input_string).
     Returns an immutable configuration ready for execution.
     """
-    blank = blank_symbol
-    tape = tuple([blank] + list(input_string) + [blank] * 10)
-
-    return TMConfiguration(
-        tape=tape,
-        head=1,
-        state=initial_state,
-        steps=0,
-        blank=blank,
-        delta=delta_function,
-        accept_states=frozenset(accept_states or {"qₐ"}),
-        reject_states=frozenset(reject_states or {"qᵣ"}),
-    )
+    machine = TuringMachine(delta_function, initial_state, accept_states, reject_states, blank_symbol)
+    return machine.initial_config(input_string)
 
 
 def extend_tape_left(
@@ -93,60 +361,61 @@ def step(config: TMConfiguration) -> TMConfiguration:
     """
     Execute one step of the TM.
 
-    Takes a configuration and returns a new configuration after one transition.
-    Does not mutate the input configuration.
-    """
-    # If halted, return same configuration
-    if config.is_halted():
-        return config
-
-    # Get current symbol and apply delta function
-    current_symbol = config.current_symbol()
-    result = config.delta(config.state, current_symbol)
-
-    # If delta returns None, transition to reject state
-    if result is None:
-        if config.reject_states:
-            reject_state = next(iter(config.reject_states))
-            return replace(config, state=reject_state)
-        return config
-
-    new_state, write_symbol_val, direction = result
-
-    # Write to tape
-    new_tape = write_symbol(config.tape, config.head, write_symbol_val)
-
-    # Calculate new head position
-    new_head = config.head + (1 if direction == "R" else -1)
-
-    # Extend tape if needed
-    if new_head >= len(new_tape):
-        new_tape = extend_tape_right(new_tape, config.blank)
-    elif new_head < 0:
-        new_tape = extend_tape_left(new_tape, config.blank)
-        new_head = 10
-
-    # Return new configuration
-    return TMConfiguration(
-        tape=new_tape,
-        head=new_head,
-        state=new_state,
-        steps=config.steps + 1,
-        blank=config.blank,
-        delta=config.delta,
-        accept_states=config.accept_states,
-        reject_states=config.reject_states,
-    )
+    Thin wrapper around config.machine.step(config); does not mutate the input
+    configuration.
+    """
+    return config.machine.step(config)
+
+
+def _checkpointer(
+    every: int | None, path: str | os.PathLike[str] | None
+) -> Callable[[TMConfiguration], None] | None:
+    """Build the per-step checkpoint hook used by the run loops."""
+    if every is None:
+        return None
+    if every <= 0:
+        raise ValueError("checkpoint_every must be positive")
+    if path is None:
+        raise ValueError("checkpoint_every requires a checkpoint_path")
+
+    # Imported lazily: the snapshot module depends on this one
+    from tapeware.snapshot import save_checkpoint
+
+    def checkpoint(config: TMConfiguration) -> None:
+        if config.steps % every == 0:
+            save_checkpoint(config, path)
+
+    return checkpoint
 
 
 def run_until_halt(
-    config: TMConfiguration, max_steps: int | None = None
+    config: TMConfiguration,
+    max_steps: int | None = None,
+    checkpoint_every: int | None = None,
+    checkpoint_path: str | os.PathLike[str] | None = None,
+    backend: Literal["tuple", "rle"] = "tuple",
 ) -> TMConfiguration:
     """
     Run TM until it halts.
 
+    With checkpoint_every set, a snapshot is written to checkpoint_path every
+    time the step count reaches a multiple of it, so a crashed run can be
+    resumed with tapeware.snapshot.load_checkpoint.
+
+    backend selects the tape representation used while running: "tuple" steps
+    immutable configurations, "rle" runs on a run-length encoded tape with sweep
+    acceleration (see tapeware.rle). Both return the same configuration.
+
     Returns the final configuration.
     """
+    if backend == "rle":
+        from tapeware.rle import run_rle
+
+        return run_rle(config, max_steps, checkpoint_every, checkpoint_path)
+    if backend != "tuple":
+        raise ValueError(f"Unknown tape backend {backend!r}")
+
+    checkpoint = _checkpointer(checkpoint_every, checkpoint_path)
     current = config
     steps = 0
 
@@ -155,6 +424,8 @@ def run_until_halt(
             break
         current = step(current)
         steps += 1
+        if checkpoint is not None:
+            checkpoint(current)
 
     return current
 
@@ -0,0 +1,44 @@
+import pytest
+
+from tapeware.turing_machine import create_initial_config, run_until_halt
+from tapeware.analysis import Sweep, analyse, minimise, tabulate
+from tapeware.examples.anbncn_alt import delta, test_cases
+
+
+@pytest.mark.parametrize("input_str,expected", test_cases)
+def test_minimised_anbncn_alt(input_str: str, expected: bool) -> None:
+
+    minimised, _ = minimise(delta, "abc")
+    original = run_until_halt(create_initial_config(input_str, delta))
+    config = run_until_halt(create_initial_config(input_str, minimised))
+    assert config.is_accepted() == expected
+    assert config.tape == original.tape
+
+
+def test_report_anbncn_alt() -> None:
+
+    _, report = minimise(delta, "abc")
+    assert report.unreachable_states == set()
+    assert "qᵣ" in report.states
+    assert ("qₐ", "a") in report.dead_transitions
+    assert all(state != "qₐ" for state, _ in report.table)
+    assert Sweep("q₁", "R", frozenset({"a", "X"})) in report.sweeps
+    assert None not in report.table.values()
+    assert len(report.table) < len(tabulate(delta, "abc"))
+
+
+def test_equivalent_states_are_merged() -> None:
+
+    table = {
+        ("q₀", "a"): ("q₁", "a", "R"),
+        ("q₀", "□"): ("qₐ", "□", "R"),
+        ("q₁", "a"): ("q₂", "a", "R"),
+        ("q₁", "□"): ("qₐ", "□", "R"),
+        ("q₂", "a"): ("q₁", "a", "R"),
+        ("q₂", "□"): ("qₐ", "□", "R"),
+        ("q₉", "a"): ("q₀", "a", "R"),
+    }
+    report = analyse(table)
+    assert report.unreachable_states == {"q₉"}
+    assert report.equivalent_states == (frozenset({"q₀", "q₁", "q₂"}),)
+    assert report.table == {("q₀", "a"): ("q₀", "a", "R"), ("q₀", "□"): ("qₐ", "□", "R")}
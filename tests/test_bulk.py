@@ -0,0 +1,99 @@
+from itertools import islice
+
+import pytest
+from typer.testing import CliRunner
+
+from tapeware.__main__ import app
+from tapeware.bulk import (
+    decode,
+    encode,
+    enumerate_machines,
+    format_machine,
+    machine_count,
+    run_bulk,
+    simulate,
+    to_machine,
+)
+from tapeware.turing_machine import run_until_halt
+
+# Busy beaver champions: 1RB1LB_1LA1RZ and 1RB2LB1RZ_2LA2RB1LB
+BB_2_2 = encode([(1, 1, 1), (1, -1, 1), (1, -1, 0), (1, 1, 2)], 2, 2)
+BB_2_3 = encode([(1, 1, 1), (2, -1, 1), (1, 1, 2), (2, -1, 0), (2, 1, 1), (1, -1, 1)], 2, 3)
+
+
+def test_encoding_round_trips() -> None:
+
+    for code in (0, BB_2_2, machine_count(2, 2) - 1):
+        assert encode(decode(code, 2, 2), 2, 2) == code
+    assert format_machine(BB_2_2, 2, 2) == "1RB1LB_1LA1RZ"
+    assert format_machine(BB_2_3, 2, 3) == "1RB2LB1RZ_2LA2RB1LB"
+
+    with pytest.raises(ValueError):
+        decode(machine_count(2, 2), 2, 2)
+    with pytest.raises(ValueError):
+        encode([(2, 1, 0)] * 4, 2, 2)
+
+
+def test_simulate_busy_beavers() -> None:
+
+    result = simulate(BB_2_2, 2, 2)
+    assert (result.outcome, result.steps, result.sigma, result.tape) == ("halted", 6, 4, (1, 1, 1, 1))
+
+    result = simulate(BB_2_3, 2, 3)
+    assert (result.outcome, result.steps, result.sigma) == ("halted", 38, 9)
+
+    # The decoded machine runs the same on the generic simulator
+    final = run_until_halt(to_machine(BB_2_3, 2, 3).initial_config(""))
+    assert final.is_accepted()
+    assert final.steps == 38
+
+
+def test_simulate_prunes_cycles_and_escapes() -> None:
+
+    # A0 -> 1RB, B0 -> 0LA, A1 -> 1RB: bounces between two cells forever
+    result = simulate(encode([(1, 1, 1), (1, 1, 1), (0, -1, 0), (0, -1, 0)], 2, 2), 2, 2)
+    assert result.outcome == "cycle"
+    assert result.steps < 10
+
+    # A0 -> 1RB, then B keeps moving right over blanks
+    result = simulate(encode([(1, 1, 1), (0, 1, 0), (1, 1, 1), (0, 1, 0)], 2, 2), 2, 2)
+    assert result.outcome == "escape"
+    assert result.steps == 1
+
+    result = simulate(BB_2_3, 2, 3, max_steps=10)
+    assert (result.outcome, result.steps) == ("timeout", 10)
+
+
+def test_enumerate_and_run_all_two_state_machines() -> None:
+
+    codes = list(enumerate_machines(2, 2))
+    assert len(codes) == machine_count(2, 2) // 6
+    assert BB_2_2 in codes
+
+    halted = [result for result in run_bulk(codes, 2, 2, max_steps=100, jobs=1) if result.outcome == "halted"]
+    assert max(result.steps for result in halted) == 6
+    assert max(result.sigma for result in halted) == 4
+    assert len(list(enumerate_machines(2, 2, prune=False))) == machine_count(2, 2)
+
+
+def test_run_bulk_across_processes_matches_in_process() -> None:
+
+    codes = list(islice(enumerate_machines(2, 3), 0, 20000, 97))
+    parallel = list(run_bulk(codes, 2, 3, (1, 2), max_steps=200, jobs=2, chunksize=16))
+    assert parallel == list(run_bulk(codes, 2, 3, (1, 2), max_steps=200, jobs=1))
+
+    with pytest.raises(ValueError):
+        list(run_bulk(codes, 2, 3, jobs=0))
+    with pytest.raises(ValueError):
+        simulate(BB_2_2, 2, 2, (2,))
+
+
+def test_bulk_cli() -> None:
+
+    result = CliRunner().invoke(app, ["--jobs", "1", "bulk", "2", "2", "--top", "1"])
+    assert result.exit_code == 0
+    assert result.output.startswith("3456 machines: halted ")
+    assert "1RB1LB_1LA1LZ  1111" in result.output
+
+    result = CliRunner().invoke(app, ["bulk", "2", "2", "--input", "2"])
+    assert result.exit_code != 0
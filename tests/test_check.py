@@ -0,0 +1,57 @@
+import json
+from xml.etree import ElementTree
+
+from typer.testing import CliRunner
+
+from tapeware.__main__ import app
+from tapeware.check import format_json, format_junit, run_checks
+from tapeware.examples.end_ab import delta, test_cases
+
+runner = CliRunner()
+
+
+def test_run_checks_in_workers() -> None:
+
+    results = run_checks([(delta, input_str, expected) for input_str, expected in test_cases], jobs=2)
+    assert [r.input for r in results] == [input_str for input_str, _ in test_cases]
+    assert all(r.passed for r in results)
+
+
+def test_mismatch_is_reported() -> None:
+
+    results = run_checks([(delta, "ab", False), (delta, "ba", None)], jobs=1)
+    assert [r.passed for r in results] == [False, True]
+    assert json.loads(format_json(results))[0]["passed"] is False
+    suite = ElementTree.fromstring(format_junit(results)).find("testsuite")
+    assert suite is not None and suite.get("failures") == "1"
+
+
+def test_cli_check_all() -> None:
+
+    result = runner.invoke(app, ["--check", "--jobs", "1", "all"])
+    assert result.exit_code == 0
+    assert "0 failed" in result.output
+
+
+def test_cli_check_single_input() -> None:
+
+    result = runner.invoke(app, ["--check", "--report", "json", "end-ab", "ba"])
+    assert result.exit_code == 0
+    assert json.loads(result.output)[0]["accepted"] is False
+
+
+def test_non_halting_case_times_out() -> None:
+
+    def loop(state: str, symbol: str) -> tuple[str, str, str] | None:
+        return (state, symbol, "R")
+
+    (result,) = run_checks([(loop, "ab", None)], jobs=1, max_steps=100)
+    assert not result.halted and not result.passed
+    assert result.outcome == "TIMEOUT"
+    assert result.steps == 100
+
+
+def test_cli_rejects_zero_jobs() -> None:
+
+    result = runner.invoke(app, ["--check", "--jobs", "0", "all"])
+    assert result.exit_code == 2
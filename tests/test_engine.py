@@ -0,0 +1,55 @@
+import pytest
+from typer.testing import CliRunner
+
+from tapeware.__main__ import app
+from tapeware.engine import Engine
+from tapeware.turing_machine import create_initial_config, run_until_halt, run_with_history
+from tapeware.examples.anbncn_alt import delta, test_cases
+
+
+@pytest.mark.parametrize("input_str,expected", test_cases)
+def test_engine_scrubs_history(input_str: str, expected: bool) -> None:
+
+    config = create_initial_config(input_str, delta)
+    history = run_with_history(config)
+    engine = Engine(config)
+    engine.run()
+    assert engine.is_accepted() == expected
+    assert engine.config() == run_until_halt(config)
+
+    # Every entry of the history is reachable by undoing, without having stored it
+    for previous in reversed(history[:-1]):
+        assert engine.unstep()
+        assert engine.config() == previous
+    assert not engine.unstep()
+
+
+def test_engine_undo_log_is_compact() -> None:
+
+    engine = Engine(create_initial_config("aaabbbccc", delta))
+    taken = engine.run()
+    assert engine.position == taken
+    assert engine.undo_symbols.itemsize + engine.undo_states.itemsize == 3
+    assert engine.seek(10) == 10
+    assert engine.config() == run_until_halt(create_initial_config("aaabbbccc", delta), 10)
+
+
+def test_engine_left_extension() -> None:
+
+    def walk_left(state: str, symbol: str) -> tuple[str, str, str] | None:
+        return ("q₀", "X", "L") if state == "q₀" and symbol != "X" else ("qₐ", symbol, "R")
+
+    config = create_initial_config("", walk_left)
+    engine = Engine(config)
+    engine.run(40)
+    assert engine.config() == run_until_halt(config, 40)
+    engine.run_back()
+    assert engine.config() == config
+
+
+def test_cli_debug() -> None:
+
+    result = CliRunner().invoke(app, ["debug", "anbncn-alt", "abc"], input="n 5\nb 2\ne\nq\n")
+    assert result.exit_code == 0
+    assert "[3] debug>" in result.output
+    assert "Step 14" in result.output
@@ -0,0 +1,68 @@
+from fractions import Fraction
+
+from typer.testing import CliRunner
+
+from tapeware.__main__ import app
+from tapeware.examples import anbncn, anbncn_alt
+from tapeware.profiler import FAMILIES, fit_growth, format_csv, format_report, measure, profile
+
+
+def test_profile_matches_readme_growth_series() -> None:
+
+    ns = list(range(1, 8))
+    for module, formula in ((anbncn, "5n² + 4n + 1"), (anbncn_alt, "4n² + 7n + 3")):
+        runs = profile(module.delta, FAMILIES["anbncn"], ns)
+        assert all(run.accepted for run in runs)
+        fit = fit_growth(ns, [run.steps for run in runs])
+        assert fit.degree == 2
+        assert str(fit) == formula
+
+
+def test_measure_tracks_tape_usage() -> None:
+
+    run = measure("aabbcc", anbncn.delta, n=2)
+    assert run.input_length == 6
+    # Input plus the blank on either side
+    assert run.cells_visited == 8
+    assert run.tape_extent == 8
+    assert run.head_reversals == 4
+    assert run.within_linear_bound
+
+
+def test_measure_flags_leaving_linear_bound() -> None:
+
+    # Walks right over blanks forever
+    delta = lambda state, symbol: ("q₀", symbol, "R") if state == "q₀" else None  # noqa: E731
+    run = measure("ab", delta, max_steps=10)
+    assert not run.halted
+    assert run.steps == 10
+    assert not run.within_linear_bound
+    assert "LEAVES LINEAR BOUND for n = 0" in format_report("walker", [run])
+
+
+def test_fit_growth() -> None:
+
+    ns = [1, 2, 3, 4]
+    assert fit_growth(ns, [3, 5, 7, 9]).coefficients == (Fraction(1), Fraction(2))
+    assert str(fit_growth(ns, [7, 7, 7, 7])) == "7"
+    assert str(fit_growth(ns, [0, 3, 8, 15])) == "n² - 1"
+
+    exponential = fit_growth([1, 2, 3, 4, 5, 6], [2, 4, 8, 16, 32, 64])
+    assert exponential.degree is None
+    assert exponential.exponent > 3
+
+
+def test_profile_cli() -> None:
+
+    result = CliRunner().invoke(app, ["profile", "anbncn", "anbncn-alt", "--n-max", "3", "--csv"])
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].startswith("machine,n,input_length,steps")
+    assert lines[1] == "anbncn,1,3,10,5,5,2,True,True,True"
+    assert len(lines) == 7
+    assert format_csv({}) == lines[0] + "\n"
+
+    result = CliRunner().invoke(app, ["profile", "anbncn-alt", "--n-max", "5"])
+    assert result.exit_code == 0
+    assert "steps: 4n² + 7n + 3" in result.output
+    assert "Stays within its linear bound" in result.output
@@ -0,0 +1,57 @@
+import importlib
+
+import pytest
+
+from tapeware.turing_machine import create_initial_config, run_until_halt
+from tapeware.rle import RunLengthTape
+
+EXAMPLES = ("anbn", "anbncn", "anbncn_alt", "end_ab", "equal_01")
+CASES = [
+    (name, input_str, expected)
+    for name in EXAMPLES
+    for input_str, expected in importlib.import_module(f"tapeware.examples.{name}").test_cases
+]
+
+
+@pytest.mark.parametrize("name,input_str,expected", CASES)
+def test_rle_examples(name: str, input_str: str, expected: bool) -> None:
+
+    delta = importlib.import_module(f"tapeware.examples.{name}").delta
+    config = create_initial_config(input_str, delta)
+    final = run_until_halt(config, backend="rle")
+    assert final.is_accepted() == expected
+    assert final == run_until_halt(config)
+
+
+@pytest.mark.parametrize("max_steps", [0, 1, 7, 40, 41])
+def test_rle_max_steps(max_steps: int) -> None:
+
+    delta = importlib.import_module("tapeware.examples.anbncn").delta
+    config = create_initial_config("aaabbbccc", delta)
+    assert run_until_halt(config, max_steps, backend="rle") == run_until_halt(config, max_steps)
+
+
+def test_rle_memory_is_proportional_to_runs() -> None:
+
+    tape = RunLengthTape(tuple("□" + "a" * 1000 + "b" * 1000 + "□"), 1, "□")
+    assert len(tape.runs()) == 4
+    tape.write("X")
+    tape.move("R")
+    assert tape.runs()[:3] == [("□", 1), ("X", 1), ("a", 999)]
+    assert tape.sweep("R") == 999
+    assert tape.read() == "b"
+
+
+def test_rle_left_extension() -> None:
+
+    def delta(state: str, symbol: str) -> tuple[str, str, str] | None:
+        if state == "q₀":
+            return ("q₀", "X", "L") if symbol != "□" else ("q₁", "Y", "L")
+        if state == "q₁":
+            return ("qₐ", "Z", "R") if symbol == "□" else None
+        return None
+
+    config = create_initial_config("ab", delta)
+    final = run_until_halt(config)
+    assert final.content() == (-1, ("Z", "Y", "X", "b"))
+    assert run_until_halt(config, backend="rle") == final
@@ -0,0 +1,137 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from tapeware import shared
+from tapeware.engine import Engine
+from tapeware.shared import SharedTape, SharedTapeView
+from tapeware.turing_machine import create_initial_config, run_until_halt
+from tapeware.examples.anbncn_alt import delta
+
+
+def walker(state: str, symbol: str) -> tuple[str, str, str] | None:
+    """Write 1s to the right forever."""
+    return "q₀", "1", "R"
+
+
+def read_state(path: str) -> tuple[str, int, str]:
+    with SharedTapeView(path) as view:
+        snapshot = view.snapshot()
+        return snapshot.state, snapshot.steps, "".join(snapshot.config().tape)
+
+
+def snapshot_while_running(path: str, count: int) -> list[tuple[int, int, int]]:
+    seen = []
+    with SharedTapeView(path) as view:
+        while len(seen) < count:
+            snapshot = view.snapshot()
+            if not seen or snapshot.steps != seen[-1][0]:
+                ones = snapshot.cells.count(snapshot.symbols.index("1"))
+                seen.append((snapshot.steps, ones, snapshot.head - snapshot.origin))
+    return seen
+
+
+def test_shared_tape_is_readable_from_another_process() -> None:
+
+    config = create_initial_config("aabbcc", delta)
+    engine = Engine(config, shared=SharedTape())
+    engine.run()
+    final = run_until_halt(config)
+
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        state, steps, tape = pool.submit(read_state, engine.shared.path).result()
+    assert (state, steps) == (final.state, final.steps)
+    assert tape.strip(final.blank) == "".join(final.tape).strip(final.blank)
+
+    with SharedTapeView(engine.shared.path) as view:
+        assert view.snapshot().config() == final
+        assert (view.head, view.state_id, view.steps) == (engine.head, engine.state_id, engine.steps)
+
+        # Views are zero-copy and read-only
+        cells = view.cells
+        assert cells.readonly
+        assert cells[view.head] == engine.tape[engine.head]
+        with pytest.raises(TypeError):
+            cells[0] = 1
+        cells.release()
+
+        # Undoing is published too
+        engine.run_back(5)
+        assert view.steps == final.steps - 5
+        assert view.snapshot().config() == engine.config()
+    engine.close()
+
+
+def test_snapshots_taken_during_a_run_are_consistent() -> None:
+
+    engine = Engine(create_initial_config("", walker), record=False, shared=SharedTape(capacity=1024))
+    start = engine.head - engine.origin
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        future = pool.submit(snapshot_while_running, engine.shared.path, 30)
+        for _ in range(1000):
+            if future.done():
+                break
+            engine.run(10_000)
+        seen = future.result(timeout=10)
+    engine.close()
+
+    # Every snapshot is a configuration the machine actually went through
+    assert len(seen) == 30
+    for steps, ones, head in seen:
+        assert ones == steps
+        assert head == start + steps
+
+
+def test_shared_tape_grows_into_new_generations() -> None:
+
+    engine = Engine(create_initial_config("", walker), record=False, shared=SharedTape(capacity=16), publish_every=7)
+    path = engine.shared.path
+    closed = SharedTapeView(path)
+    with SharedTapeView(path) as view:
+        assert view.generation == 0
+        assert not view.refresh()
+
+        engine.run(100)
+        assert view.refresh()
+        assert view.generation == engine.shared.generation > 0
+        assert len(view.cells) == len(engine.tape) >= 100
+        snapshot = view.snapshot()
+        assert snapshot.steps == 100
+        assert snapshot.config(walker) == engine.config()
+        assert snapshot.config(walker).tape == ("1",) * 100 + ("□",)
+
+    # Only the current segment is left, and close removes everything
+    assert sorted(name for name in os.listdir(os.path.dirname(path)) if name.startswith(os.path.basename(path))) == [
+        os.path.basename(path),
+        f"{os.path.basename(path)}.{engine.shared.generation}",
+    ]
+    engine.close()
+    assert not os.path.exists(path)
+
+    # Views still attached to an older generation fail instead of waiting forever
+    with pytest.raises(ValueError):
+        closed.snapshot()
+    closed.close()
+
+    # The engine keeps running in private memory
+    assert engine.run(10) == 10
+    assert engine.config().tape.count("1") == 110
+
+
+def test_shared_tape_view_rejects_other_files(tmp_path) -> None:
+
+    path = tmp_path / "tape"
+    path.write_bytes(b"\0" * 16)
+    with pytest.raises(ValueError):
+        SharedTapeView(path)
+
+
+def test_shared_tape_view_gives_up_on_missing_segments(monkeypatch: pytest.MonkeyPatch) -> None:
+
+    monkeypatch.setattr(shared, "RETRY_SECONDS", 0.05)
+    engine = Engine(create_initial_config("ab", walker), shared=SharedTape())
+    os.unlink(f"{engine.shared.path}.{engine.shared.generation}")
+    with pytest.raises(TimeoutError):
+        SharedTapeView(engine.shared.path)
+    engine.close()
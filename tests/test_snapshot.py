@@ -0,0 +1,73 @@
+import os
+import struct
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from tapeware.turing_machine import create_initial_config, run_until_halt
+from tapeware.snapshot import dumps, loads, load_checkpoint
+from tapeware.examples.anbncn import delta, test_cases
+
+
+@pytest.mark.parametrize("input_str,expected", test_cases)
+def test_resume_from_snapshot(input_str: str, expected: bool) -> None:
+
+    config = run_until_halt(create_initial_config(input_str, delta), max_steps=7)
+    restored = loads(dumps(config))
+    assert restored == config
+    assert run_until_halt(restored).is_accepted() == expected
+
+
+def test_snapshot_rejects_changed_machine() -> None:
+
+    data = dumps(create_initial_config("abc", delta))
+    with pytest.raises(ValueError):
+        loads(data, lambda state, symbol: None)
+
+
+def test_checkpoint_every(tmp_path: Path) -> None:
+
+    path = tmp_path / "run.twsn"
+    config = create_initial_config("aabbcc", delta)
+    final = run_until_halt(config, checkpoint_every=5, checkpoint_path=path)
+    restored = load_checkpoint(path)
+    assert restored.steps == final.steps - final.steps % 5
+    assert run_until_halt(restored) == final
+
+
+SEED_SCRIPT = """
+from tapeware.snapshot import machine_fingerprint
+def delta(state, symbol):
+    return (state, symbol, "R") if symbol in {"a", "b", "c", "X", "Y", "Z"} else None
+print(machine_fingerprint(delta).hex())
+"""
+
+
+def test_fingerprint_is_independent_of_hash_seed() -> None:
+
+    fingerprints = set()
+    for seed in ("0", "1", "2", "3"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        result = subprocess.run(
+            [sys.executable, "-c", SEED_SCRIPT], env=env, capture_output=True, text=True, check=True
+        )
+        fingerprints.add(result.stdout.strip())
+    assert len(fingerprints) == 1
+
+
+def test_malformed_snapshot_raises_value_error() -> None:
+
+    data = dumps(create_initial_config("aabbcc", delta))
+    for end in range(len(data)):
+        with pytest.raises(ValueError):
+            loads(data[:end])
+
+    # The head must point into the stored tape
+    length = len(create_initial_config("aabbcc", delta).tape)
+    for head in (-1, length):
+        corrupt = bytearray(data)
+        struct.pack_into("<q", corrupt, 5, head)
+        with pytest.raises(ValueError):
+            loads(bytes(corrupt))
@@ -0,0 +1,44 @@
+import os
+import subprocess
+import sys
+
+from tapeware.turing_machine import create_initial_config, run_until_halt
+from tapeware.examples.anbn import delta
+
+SCRIPT = """
+from tapeware.turing_machine import create_initial_config, run_until_halt
+from tapeware.examples.anbn import delta
+config = create_initial_config("aab", delta, reject_states={"r3", "r1", "r2", "r0x"})
+print(run_until_halt(config).state, run_until_halt(config, backend="rle").state)
+"""
+
+
+def test_reject_target_is_canonical() -> None:
+
+    outputs = set()
+    for seed in ("0", "1", "2", "3"):
+        env = {**os.environ, "PYTHONHASHSEED": seed}
+        result = subprocess.run([sys.executable, "-c", SCRIPT], env=env, capture_output=True, text=True, check=True)
+        outputs.add(result.stdout.strip())
+    assert outputs == {"r0x r0x"}
+
+
+def test_halting_flags() -> None:
+
+    config = create_initial_config("aab", delta, reject_states={"no"})
+    states = config.machine.states
+    assert states.names[:3] == ["qₐ", "no", "q₀"]
+    assert list(states.halting[:3]) == [1, 1, 0]
+    assert list(states.accepting[:3]) == [1, 0, 0]
+    assert not config.is_halted()
+    assert run_until_halt(config).state == "no"
+
+
+def test_machines_do_not_share_indexes() -> None:
+
+    def other(state: str, symbol: str) -> tuple[str, str, str] | None:
+        return ("qₐ", symbol, "R")
+
+    config = create_initial_config("ab", delta)
+    assert create_initial_config("ab", other).machine.states is not config.machine.states
+    assert run_until_halt(config).machine.states is config.machine.states
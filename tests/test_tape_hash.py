@@ -0,0 +1,38 @@
+from dataclasses import replace
+
+import pytest
+
+from tapeware.turing_machine import create_initial_config, run_with_history, tape_hash
+from tapeware.examples.anbncn_alt import delta, test_cases
+
+
+def left_walker(state: str, symbol: str) -> tuple[str, str, str] | None:
+    if state == "q₀":
+        return ("q₀", "X", "L") if symbol != "□" else ("q₁", "Y", "L")
+    if state == "q₁":
+        return ("qₐ", symbol, "R")
+    return None
+
+
+@pytest.mark.parametrize("input_str,expected", test_cases)
+def test_incremental_hash(input_str: str, expected: bool) -> None:
+
+    for config in run_with_history(create_initial_config(input_str, delta)):
+        assert config.tape_hash == tape_hash(config.tape, config.blank, config.origin)
+
+
+def test_hash_survives_left_extension() -> None:
+
+    history = run_with_history(create_initial_config("ab", left_walker))
+    assert history[-1].origin > 0
+    for config in history:
+        assert config.tape_hash == tape_hash(config.tape, config.blank, config.origin)
+
+
+def test_blank_padding_is_ignored() -> None:
+
+    config = create_initial_config("abc", delta)
+    padded = replace(config, tape=("□",) * 5 + config.tape + ("□",) * 7, head=config.head + 5, origin=5)
+    assert padded == config
+    assert hash(padded) == hash(config)
+    assert len({config, padded}) == 1
@@ -0,0 +1,44 @@
+from tapeware.turing_machine import TuringMachine, create_initial_config, run_with_history
+from tapeware.examples.anbncn import delta
+
+
+def test_move_left_off_tape() -> None:
+
+    def walk_left(state: str, symbol: str) -> tuple[str, str, str] | None:
+        if state == "q₀":
+            return ("q₁", "X", "L")
+        if state == "q₁":
+            return ("qₐ", "Y", "L")
+        return None
+
+    config = create_initial_config("ab", walk_left)
+    history = run_with_history(config)
+    # Second move leaves the tape: the head lands on a fresh blank, left of the old first cell
+    assert history[-1].current_symbol() == "□"
+    assert history[-1].tape[history[-1].head + 1] == "Y"
+    assert history[-1].content() == (0, ("Y", "X", "b"))
+
+
+def test_configurations_share_the_machine() -> None:
+
+    machine = TuringMachine(delta)
+    history = run_with_history(machine.initial_config("aabbcc"))
+    assert history[-1].is_accepted()
+    assert all(config.machine is machine for config in history)
+    assert not hasattr(history[-1], "__dict__")
+    assert machine.transitions
+    assert history[0] == create_initial_config("aabbcc", delta)
+
+
+def test_machine_analysis_is_cached() -> None:
+
+    machine = TuringMachine(delta)
+    report = machine.analyse("abc")
+    assert machine.analyse("cba") is report
+    assert any(sweep.state == "q₁" for sweep in report.sweeps)
+
+    # A different input alphabet gets its own report
+    smaller = machine.analyse("ab")
+    assert "c" not in smaller.alphabet
+    assert "c" in report.alphabet
+    assert machine.analyse("abc") is report